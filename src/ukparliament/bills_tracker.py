@@ -1,15 +1,173 @@
 import asyncio
-from datetime import datetime, timedelta
-from typing import Any, Union
+import logging
+import random
+import re
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from io import BytesIO
+from typing import Union
 
-import lxml
 from aiohttp.client import ClientSession
-from bs4 import BeautifulSoup
+from cachetools import LRUCache
+from lxml import etree
 
+from . import utils
 from .utils import BetterEnum
 
+_ATOM_UPDATED = "{http://www.w3.org/2005/Atom}updated"
+_RFC822_FORMAT = "%a, %d %b %Y %H:%M:%S %z"
+_RFC822_PATTERN = re.compile(
+    r"^[A-Za-z]{3}, (\d{1,2}) ([A-Za-z]{3}) (\d{4}) (\d{2}):(\d{2}):(\d{2}) "
+    r"(Z|GMT|UT|[+\-]\d{2}:?\d{2})$"
+)
+_log = logging.getLogger(__name__)
+
+_POLL_INTERVAL = 30
+_MAX_POLL_INTERVAL = 600
+_MAX_FETCH_RETRIES = 4
+_PUBLICATION_UPDATE_LIMIT = 20
+_MAX_CONCURRENT_UPDATES = 64
+_SEEN_UPDATES_SIZE = 100_000
+_MONTHS = {
+    "Jan": 1,
+    "Feb": 2,
+    "Mar": 3,
+    "Apr": 4,
+    "May": 5,
+    "Jun": 6,
+    "Jul": 7,
+    "Aug": 8,
+    "Sep": 9,
+    "Oct": 10,
+    "Nov": 11,
+    "Dec": 12,
+}
+
+
+@lru_cache(maxsize=4096)
+def _parse_rfc822(date_string: str) -> datetime:
+    """
+    Parses an RFC-822 date, as used by rss feeds for lastBuildDate and pubDate. The fields
+    are read straight from a precompiled pattern rather than through strptime's format
+    interpreter, falling back to strptime for anything the pattern doesn't cover. Results
+    are memoized, as the same dates repeat across the items and feeds of a poll.
+
+    Parameters
+    ----------
+    date_string: :class:`str`
+        The date, e.g. 'Sat, 13 Nov 2021 10:00:00 Z'.
+
+    Returns
+    -------
+    A timezone aware :class:`datetime`.
+    """
+    match = _RFC822_PATTERN.match(date_string)
+    if match is None:
+        return datetime.strptime(date_string, _RFC822_FORMAT)
+
+    day, month, year, hour, minute, second, zone = match.groups()
+    month_number = _MONTHS.get(month.capitalize())
+    if month_number is None:
+        return datetime.strptime(date_string, _RFC822_FORMAT)
+
+    if zone in ("Z", "GMT", "UT"):
+        tzinfo = timezone.utc
+    else:
+        offset = timedelta(hours=int(zone[1:3]), minutes=int(zone[-2:]))
+        tzinfo = timezone(-offset if zone[0] == "-" else offset)
+    return datetime(
+        int(year),
+        month_number,
+        int(day),
+        int(hour),
+        int(minute),
+        int(second),
+        tzinfo=tzinfo,
+    )
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso_z(date_string: str) -> datetime:
+    """
+    Parses an ISO-8601 date, as used by the a10:updated field of the all bills rss feed.
+    Results are memoized.
+
+    Parameters
+    ----------
+    date_string: :class:`str`
+        The date, e.g. '2021-11-13T09:00:00Z'.
+
+    Returns
+    -------
+    A timezone aware :class:`datetime`. Dates with a trailing 'Z' or no offset are taken as UTC.
+    """
+    parsed = datetime.fromisoformat(
+        date_string[:-1] if date_string.endswith("Z") else date_string
+    )
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=timezone.utc)
+
+
+def _retry_delay(resp, attempt: int) -> float:
+    """
+    Works out how long to wait before retrying a rate limited or failed request. The
+    Retry-After header is honoured if it is given in seconds, otherwise the delay backs
+    off exponentially with some jitter.
+
+    Parameters
+    ----------
+    resp: :class:`ClientResponse`
+        The response of the failed request.
+    attempt: :class:`int`
+        The number of attempts made so far, starting at 0.
+
+    Returns
+    -------
+    The delay in seconds.
+    """
+    retry_after = resp.headers.get("Retry-After", "")
+    if retry_after.isdigit():
+        return float(retry_after)
+    return 2 ** attempt * 0.5 + random.random()
+
+
+def _iter_feed(body: bytes, tags: tuple[str, ...] = ("lastBuildDate", "item")):
+    """
+    Streams the channel's lastBuildDate and item elements of an rss feed.
+
+    Parameters
+    ----------
+    body: :class:`bytes`
+        The raw rss feed.
+    tags: :class:`tuple`
+        The names of the elements to stream.
+
+    Returns
+    -------
+    An iterator of lxml elements. Each element is cleared and detached from the tree once
+    the consumer moves on, so the parsed tree doesn't grow with the feed.
+    """
+    for _, element in etree.iterparse(
+        BytesIO(body), events=("end",), tag=tags
+    ):
+        yield element
+        element.clear()
+        parent = element.getparent()
+        while element.getprevious() is not None:
+            del parent[0]
+
 
 class FeedUpdate:
+    __slots__ = (
+        "_stage",
+        "_stage_lower",
+        "_guid",
+        "_bill_id",
+        "_categories",
+        "_title",
+        "_description",
+        "_updated",
+    )
+
     def __init__(self, feed_update_object):
         """
         A feed update is an entry on the RRS feed. This class processes the xml update into
@@ -17,29 +175,40 @@ class FeedUpdate:
 
         Parameters
         ----------
-        feed_update_object: :class:'object'
-            The feed update object as a directory.
+        feed_update_object: :class:`lxml.etree._Element`
+            The item element of the feed update.
         """
+        p4_namespace = feed_update_object.nsmap.get("p4")
         self._stage = (
-            feed_update_object.attrs["p4:stage"]
-            if "p4:stage" in feed_update_object.attrs
+            feed_update_object.get(f"{{{p4_namespace}}}stage")
+            if p4_namespace is not None
             else None
         )
-        self._guid = feed_update_object.guid.text
-        self._bill_id = self._guid.split("/")[-1]
-        self._categories = [
-            c.text.lower() for c in feed_update_object.find_all("category")
-        ]
-        self._title = feed_update_object.title.text
-        self._description = feed_update_object.description.text.replace(
-            "<description>", ""
-        ).replace("</description>", "")
-        updated_string_date = feed_update_object.find("a10:updated").text
-        self._updated = (
-            datetime.strptime(updated_string_date, "%Y-%m-%dT%H:%M:%SZ")
-            if "Z" in updated_string_date
-            else datetime.fromisoformat(updated_string_date)
-        )
+        self._stage_lower = self._stage.lower() if self._stage is not None else ""
+
+        # A single pass over the children, rather than a findtext lookup per field.
+        guid = title = description = updated = None
+        categories = []
+        for child in feed_update_object:
+            tag = child.tag
+            if tag == "category":
+                if child.text:
+                    categories.append(child.text.lower())
+            elif tag == "guid":
+                guid = child.text or ""
+            elif tag == "title":
+                title = child.text or ""
+            elif tag == "description":
+                description = child.text
+            elif tag == _ATOM_UPDATED:
+                updated = child.text
+
+        self._guid = guid
+        self._bill_id = guid.split("/")[-1]
+        self._categories = frozenset(categories)
+        self._title = title
+        self._description = description or ""
+        self._updated = _parse_iso_z(updated)
 
     def get_bill_id(self):
         return self._bill_id
@@ -47,6 +216,9 @@ class FeedUpdate:
     def get_stage(self):
         return self._stage
 
+    def get_stage_lower(self):
+        return self._stage_lower
+
     def get_guid(self):
         return self._guid
 
@@ -64,6 +236,14 @@ class FeedUpdate:
 
 
 class PublicationUpdate:
+    __slots__ = (
+        "_guid",
+        "_category",
+        "_title",
+        "_description",
+        "_publication_date",
+    )
+
     def __init__(self, publication_update):
         """
         A publication update is similar to that of a :class:`FeedUpdate`. However the difference is that
@@ -71,16 +251,14 @@ class PublicationUpdate:
 
         Parameters
         ----------
-        publication_update: :class:`object`
-            The publication feed update in parsed by bs4.
-        """
-        self._guid = publication_update.guid.text
-        self._category = publication_update.category.text
-        self._title = publication_update.title.text
-        self._description = publication_update.description.text
-        self._publication_date = datetime.strptime(
-            publication_update.pubdate.text, "%a, %d %b %Y %H:%M:%S %z"
-        )
+        publication_update: :class:`lxml.etree._Element`
+            The item element of the publication feed update.
+        """
+        self._guid = publication_update.findtext("guid")
+        self._category = publication_update.findtext("category")
+        self._title = publication_update.findtext("title")
+        self._description = publication_update.findtext("description")
+        self._publication_date = _parse_rfc822(publication_update.findtext("pubDate"))
 
     def get_guid(self) -> str:
         """
@@ -133,6 +311,21 @@ class BillsStorage:
         """
         pass
 
+    async def add_feed_updates(self, updates: list[tuple[int, FeedUpdate]]):
+        """
+        Add a batch of feed updates to the storage medium. Called once per poll by
+        :class:`BillsTracker`. By default this falls back to :meth:`add_feed_update` for each
+        update, storage mediums that can write many entries in one round trip should override it.
+
+        Parameters
+        ----------
+        updates: :class:`list`
+            A list of tuples of a bill id and the :class:`FeedUpdate` associated with it.
+        """
+        await asyncio.gather(
+            *[self.add_feed_update(bill_id, update) for bill_id, update in updates]
+        )
+
     async def has_update_stored(self, bill_id: int, update: FeedUpdate):
         """
         Check if a feed update associated with a bill has been stored in the storage medium.
@@ -146,6 +339,27 @@ class BillsStorage:
         """
         pass
 
+    async def has_updates_stored(self, updates: list[tuple[int, FeedUpdate]]):
+        """
+        Check which of a batch of feed updates have been stored in the storage medium. Called
+        once per poll by :class:`BillsTracker`. By default this falls back to
+        :meth:`has_update_stored` for each update, storage mediums that can look up many
+        entries in one round trip should override it.
+
+        Parameters
+        ----------
+        updates: :class:`list`
+            A list of tuples of a bill id and the :class:`FeedUpdate` associated with it.
+
+        Returns
+        -------
+        A :class:`list` of :class:`bool`, in the same order as 'updates', that are True if the
+        update has been stored.
+        """
+        return await asyncio.gather(
+            *[self.has_update_stored(bill_id, update) for bill_id, update in updates]
+        )
+
     async def get_last_update(self, bill_id: int):
         """
         Fetches the most recent entry associated with the bill id.
@@ -174,6 +388,26 @@ class BillsStorage:
         """
         pass
 
+    async def add_publication_updates(
+        self, updates: list[tuple[int, PublicationUpdate]]
+    ):
+        """
+        Add a batch of publication updates to the storage medium. Called once per poll by
+        :class:`PublicationsTracker`. By default this falls back to
+        :meth:`add_publication_update` for each update.
+
+        Parameters
+        ----------
+        updates: :class:`list`
+            A list of tuples of a bill id and the :class:`PublicationUpdate` associated with it.
+        """
+        await asyncio.gather(
+            *[
+                self.add_publication_update(bill_id, update)
+                for bill_id, update in updates
+            ]
+        )
+
     async def has_publication_update(self, bill_id: int, update: PublicationUpdate):
         """
         Check if a publication updated associated with a bill has been stored in the storage medium.
@@ -187,6 +421,31 @@ class BillsStorage:
         """
         pass
 
+    async def has_publication_updates(
+        self, updates: list[tuple[int, PublicationUpdate]]
+    ):
+        """
+        Check which of a batch of publication updates have been stored in the storage medium.
+        Called once per poll by :class:`PublicationsTracker`. By default this falls back to
+        :meth:`has_publication_update` for each update.
+
+        Parameters
+        ----------
+        updates: :class:`list`
+            A list of tuples of a bill id and the :class:`PublicationUpdate` associated with it.
+
+        Returns
+        -------
+        A :class:`list` of :class:`bool`, in the same order as 'updates', that are True if the
+        update has been stored.
+        """
+        return await asyncio.gather(
+            *[
+                self.has_publication_update(bill_id, update)
+                for bill_id, update in updates
+            ]
+        )
+
 
 class Feed:
     """
@@ -214,6 +473,17 @@ class Feed:
         each bill.
     """
 
+    __slots__ = (
+        "bill_url",
+        "bill_id",
+        "last_update",
+        "last_publication_update",
+        "rss_individual_url",
+        "session",
+        "_etag",
+        "_last_modified",
+    )
+
     def __init__(self, bill_url: str, session: ClientSession):
 
         self.bill_url = bill_url
@@ -224,13 +494,18 @@ class Feed:
             f"https://bills-api.parliament.uk/api/v1/Rss/Bills/{self.bill_id}.rss"
         )
         self.session = session
+        self._etag = None
+        self._last_modified = None
 
     async def fetch_newest_publications(
         self,
-        update_limit: int = 20,
+        update_limit: int = _PUBLICATION_UPDATE_LIMIT,
     ):
         """
-        Used to poll a bill for publication updates
+        Used to poll a bill for publication updates. The feed is requested conditionally on the
+        ETag and Last-Modified of the previous fetch, so unchanged feeds aren't downloaded again.
+        The feed's cursor is advanced straight away, :class:`PublicationsTracker` instead only
+        advances it once the updates have been stored.
 
         Parameters
         ----------
@@ -241,56 +516,105 @@ class Feed:
         -------
         A list of :class:`PublicationUpdate` instances.
         """
-        async with self.session.get(self.rss_individual_url) as resp:
-            if resp.status != 200:
-                raise Exception(
-                    f"Couldn't fetch individual bill rss feed for bill {self.bill_id}. Status Code: {resp.status}"
-                )
+        results, cursor = await self._fetch_publications(update_limit)
+        self._advance_publications(cursor)
+        return results
 
-            soup = BeautifulSoup(await resp.text(), features="lxml")
-            rss_last_update = datetime.strptime(
-                soup.rss.channel.lastbuilddate.text, "%a, %d %b %Y %H:%M:%S %z"
-            )
+    async def _fetch_publications(self, update_limit: int):
+        """
+        Fetches the publication updates newer than the feed's cursor, without advancing it.
 
-            if self.last_publication_update is not None:
-                if self.last_publication_update >= rss_last_update:
-                    return []
+        Parameters
+        ----------
+        update_limit: :class:`int`
+            The amount to fetch in new updates.
 
-            results = []
-            for item in soup.rss.channel.find_all("item"):
-                update = PublicationUpdate(item)
-                if (
-                    self.last_publication_update is not None
-                    and update.get_publication().timestamp()
-                    < self.last_publication_update.timestamp()
-                ):
+        Returns
+        -------
+        A list of :class:`PublicationUpdate` instances and the feed's new cursor, a tuple of its
+        lastBuildDate, ETag and Last-Modified, to pass to :meth:`_advance_publications`.
+        """
+        headers = utils.conditional_headers(self._etag, self._last_modified)
+        for attempt in range(_MAX_FETCH_RETRIES + 1):
+            async with self.session.get(
+                self.rss_individual_url, headers=headers
+            ) as resp:
+                if resp.status == 304:
+                    return [], (None, self._etag, self._last_modified)
+
+                if resp.status == 200:
+                    etag = resp.headers.get("ETag")
+                    last_modified = resp.headers.get("Last-Modified")
+                    body = await resp.read()
                     break
 
-                if len(results) >= update_limit:
-                    break
+                if (
+                    resp.status != 429 and resp.status < 500
+                ) or attempt == _MAX_FETCH_RETRIES:
+                    raise Exception(
+                        f"Couldn't fetch individual bill rss feed for bill {self.bill_id}. Status Code: {resp.status}"
+                    )
+                delay = _retry_delay(resp, attempt)
+            await asyncio.sleep(delay)
+
+        rss_last_update = None
+        results = []
+        for element in _iter_feed(body):
+            if element.tag == "lastBuildDate":
+                rss_last_update = _parse_rfc822(element.text)
+                if self.last_publication_update is not None:
+                    if self.last_publication_update >= rss_last_update:
+                        return [], (None, etag, last_modified)
+                continue
+
+            if len(results) >= update_limit:
+                break
+
+            # Items are newest first, so stop streaming the feed at the first older item,
+            # before building an update for it.
+            if (
+                self.last_publication_update is not None
+                and _parse_rfc822(element.findtext("pubDate"))
+                < self.last_publication_update
+            ):
+                break
+
+            results.append(PublicationUpdate(element))
 
-                results.append(update)
+        return results, (rss_last_update, etag, last_modified)
 
+    def _advance_publications(self, cursor: tuple):
+        """
+        Advances the feed's cursor, once the updates fetched with it have been processed.
+
+        Parameters
+        ----------
+        cursor: :class:`tuple`
+            The lastBuildDate (None leaves the last publication update as is), ETag and
+            Last-Modified returned by :meth:`_fetch_publications`.
+        """
+        rss_last_update, self._etag, self._last_modified = cursor
+        if rss_last_update is not None:
             self.last_publication_update = rss_last_update
-            return results
 
-    async def process_poll_item(self, json_object):
+    async def process_poll_item(self, update: FeedUpdate):
         """
         Polls individual items from the main rss feed. Used primarily to get all the other information
         that should have been achievable through the individual bill rss feed but wasn't because heaven
         forbid anything could be _that_ simple.
-        """
-        update = FeedUpdate(json_object)
-        if self.last_update is None:
-            self.last_update = update.get_update_date()
-            return update
 
-        if self.last_update.timestamp() < update.get_update_date().timestamp():
-            print(
-                f"Feed {self.bill_id}: Last Update: {self.last_update} Date of FeedUpdate instance: "
-                f"{update.get_update_date().timestamp()}"
-            )
-            self.last_update = update.get_update_date()
+        Parameters
+        ----------
+        update: :class:`FeedUpdate`
+            The feed update parsed from the item.
+
+        Returns
+        -------
+        The :class:`FeedUpdate` if it is newer than the feed's last update, otherwise None. The last
+        update isn't advanced here, :class:`BillsTracker` does that once the update has been stored
+        and dispatched.
+        """
+        if self.last_update is None or self.last_update < update._updated:
             return update
         return None
 
@@ -301,9 +625,9 @@ class Feed:
         Parameters
         ----------
         date: :class:`datetime`
-            Last update date instance..
+            Last update date instance. A date without timezone info is taken as local time.
         """
-        self.last_update = date
+        self.last_update = date if date.tzinfo is not None else date.astimezone()
 
     def get_last_update(self) -> Union[datetime, None]:
         """
@@ -331,16 +655,46 @@ class Conditions(BetterEnum):
     a publication feed update.
     """
 
-    PUBLICATIONS = (0,)
-    LORDS = (1,)
-    COMMONS = (2,)
-    GOV_BILL = (3,)
-    PRI_BILL = (4,)
-    ROYAL_ASSENT = (5,)
+    PUBLICATIONS = 0
+    LORDS = 1
+    COMMONS = 2
+    GOV_BILL = 3
+    PRI_BILL = 4
+    ROYAL_ASSENT = 5
     ALL = 7
 
 
+def _condition_bit(condition: Conditions) -> int:
+    """
+    Returns the bit of a condition in a listener's or an update's condition mask.
+    """
+    return 1 << condition.value
+
+
+_LORDS_BIT = _condition_bit(Conditions.LORDS)
+_COMMONS_BIT = _condition_bit(Conditions.COMMONS)
+_ROYAL_ASSENT_BIT = _condition_bit(Conditions.ROYAL_ASSENT)
+_ALL_BIT = _condition_bit(Conditions.ALL)
+
+
+def _update_mask(update: FeedUpdate) -> int:
+    """
+    Returns the mask of conditions a feed update meets. Worked out once per update, a listener
+    is then invoked if its own mask shares a bit with it. Every update meets ALL.
+    """
+    mask = _ALL_BIT
+    if "lords" in update._categories:
+        mask |= _LORDS_BIT
+    if "commons" in update._categories:
+        mask |= _COMMONS_BIT
+    if "royal assent" in update._stage_lower:
+        mask |= _ROYAL_ASSENT_BIT
+    return mask
+
+
 class TrackerListener:
+    __slots__ = ("func", "conditionals", "_mask")
+
     def __init__(self, func, conditions):
         """
         A class wrapping the function that will be invoked upon a feed update, provided
@@ -356,6 +710,9 @@ class TrackerListener:
         """
         self.func = func
         self.conditionals = conditions
+        self._mask = 0
+        for condition in conditions:
+            self._mask |= _condition_bit(condition)
 
     def meets_conditions(self, update: FeedUpdate):
         """
@@ -370,26 +727,53 @@ class TrackerListener:
         -------
         A :class:`bool` that is True if all conditions are met, else False.
         """
-        if Conditions.ALL in self.conditionals:
-            return True
+        return self._mask & _update_mask(update) != 0
 
-        if Conditions.LORDS in self.conditionals:
-            if "lords" in update.get_categories():
-                return True
+    async def handle(self, feed: Feed, update: FeedUpdate):
+        await self.func(feed, update)
 
-        if Conditions.COMMONS in self.conditionals:
-            if "commons" in update.get_categories():
-                return True
 
-        if Conditions.ROYAL_ASSENT in self.conditionals:
-            if "royal assent" in (
-                update.get_stage().lower() if update.get_stage() is not None else ""
-            ):
-                return True
-        return False
+def _update_key(update: FeedUpdate) -> tuple[str, datetime]:
+    """
+    Returns the key identifying a feed update. The guid of an all bills feed entry is the
+    url of the bill, so the update date is needed to tell updates of a bill apart.
+    """
+    return update._guid, update._updated
 
-    async def handle(self, feed: Feed, update: FeedUpdate):
-        await self.func(feed, update)
+
+def _parse_all_bills(body: bytes, last_update: Union[datetime, None]):
+    """
+    Parses the all bills rss feed. Run in an executor by :class:`BillsTracker`, as the feed
+    is large enough that parsing it on the event loop would hold up every other request.
+
+    Parameters
+    ----------
+    body: :class:`bytes`
+        The raw rss feed.
+    last_update: :class:`datetime`
+        The lastBuildDate of the previously parsed feed, if any.
+
+    Returns
+    -------
+    A tuple of the feed's lastBuildDate, its ttl in minutes (None if the feed doesn't give one,
+    or it comes after an unchanged lastBuildDate) and a list of :class:`FeedUpdate` instances.
+    The list is None if the feed hasn't been built since 'last_update'.
+    """
+    rss_last_update = None
+    ttl = None
+    updates = []
+    for element in _iter_feed(body, ("ttl", "lastBuildDate", "item")):
+        if element.tag == "ttl":
+            if element.text is not None and element.text.strip().isdigit():
+                ttl = int(element.text)
+            continue
+        if element.tag == "lastBuildDate":
+            rss_last_update = _parse_rfc822(element.text)
+            if last_update is not None and last_update >= rss_last_update:
+                return rss_last_update, ttl, None
+            continue
+        updates.append(FeedUpdate(element))
+    return rss_last_update, ttl, updates
 
 
 class BillsTracker:
@@ -408,10 +792,17 @@ class BillsTracker:
         """
         self._session = session
         self._parliament = parliament
-        self._feeds: list[Feed] = []
+        self._feeds_by_url: dict[str, Feed] = {}
+        self._feeds_by_id: dict[int, Feed] = {}
         self._storage = storage
         self._listeners: list[TrackerListener] = []
         self._last_update: Union[datetime, None] = None
+        self._etag: Union[str, None] = None
+        self._last_modified: Union[str, None] = None
+        self._poll_interval = _POLL_INTERVAL
+        # Created on the first poll, on the loop the tracker runs on.
+        self._update_semaphore: Union[asyncio.Semaphore, None] = None
+        self._seen_updates = LRUCache(maxsize=_SEEN_UPDATES_SIZE)
 
     # Loads previously tracked but not yet expired feeds as well as feeds that have not yet been tracked.
     def get_parliament(self):
@@ -426,52 +817,53 @@ class BillsTracker:
         """
         return self._storage
 
+    def get_poll_interval(self) -> int:
+        """
+        Returns the seconds to wait between polls. This is the ttl of the all bills rss feed if
+        it gives a positive one, kept between 30 seconds and 10 minutes, otherwise 30 seconds.
+        """
+        return self._poll_interval
+
     async def start_event_loop(self):
         """
         Starts the event loop.
         """
+        while True:
+            await self.poll()
+            await asyncio.sleep(self._poll_interval)
 
-        async def main():
-
-            await asyncio.ensure_future(self.poll())
-            await asyncio.sleep(30)
-            await main()
-
-        await main()
-
-    async def _poll_task(self, feed: Feed, main_poll_object: Any = None):
+    async def _poll_task(
+        self, feed: Feed, update: FeedUpdate, listeners: list[TrackerListener]
+    ):
         """
-        The main function, written to process a feed entry on the rss feed and identify if it is an update.
+        Invokes the listeners whose conditions are met by an update that has just been stored. A
+        listener that raises is logged, and doesn't stop the other listeners.
 
         Parameters
         ----------
         feed: :class:`Feed`
             The feed of a bill.
-
-        main_poll_object: :class:`Any`
+        update: :class:`FeedUpdate`
             The feed entry.
-
+        listeners: :class:`list`
+            The listeners whose conditions are met by the update.
         """
-        handler_tasks = []
-        if self._listeners == 0:
-            return
-        update = await feed.process_poll_item(main_poll_object)
-        if update is None:
-            return
-        is_stored = await self._storage.has_update_stored(feed.get_id(), update)
-        if is_stored is True:
-            return
-
-        for listener in self._listeners:
-            if listener.meets_conditions(update) is False:
-                continue
-            handler_tasks.append(listener.handle(feed, update))
-            await self._storage.add_feed_update(feed.get_id(), update)
-
-        if len(handler_tasks) > 0:
-            await asyncio.gather(*handler_tasks)
+        async with self._update_semaphore:
+            results = await asyncio.gather(
+                *[listener.handle(feed, update) for listener in listeners],
+                return_exceptions=True,
+            )
+        for listener, result in zip(listeners, results):
+            if isinstance(result, Exception):
+                _log.error(
+                    "Listener %r failed on update %s of bill %s",
+                    listener.func,
+                    update.get_guid(),
+                    feed.get_id(),
+                    exc_info=result,
+                )
 
-    def get_feed(self, id: str):
+    def get_feed(self, id: Union[str, int]):
         """
         Returns a :class:`Feed` instance if one stored with the provided 'id' exists.
 
@@ -480,10 +872,7 @@ class BillsTracker:
         id: :class:`id`
             The bill id of the feed.
         """
-        for feed in self._feeds:
-            if feed.get_id() == id:
-                return feed
-        return None
+        return self._feeds_by_id.get(int(id))
 
     def register(self, func, conditionals: list[Conditions] = []):
         """
@@ -504,50 +893,125 @@ class BillsTracker:
     async def poll(self):
         """
         The main event loop function. Used to fetch the current content of the rss feed and process it.
+        The feed is requested conditionally, and the last update date, ETag and Last-Modified are only
+        recorded once every update of the feed has been processed.
         """
-        tasks = []
+        if self._update_semaphore is None:
+            self._update_semaphore = asyncio.Semaphore(_MAX_CONCURRENT_UPDATES)
         async with self._session.get(
-            "https://bills-api.parliament.uk/api/v1/Rss/allbills.rss"
+            "https://bills-api.parliament.uk/api/v1/Rss/allbills.rss",
+            headers=utils.conditional_headers(self._etag, self._last_modified),
         ) as resp:
+            if resp.status == 304:
+                return
+
             if resp.status != 200:
                 raise Exception(
                     f"Couldn't fetch rss feed for all bills. Status code: {resp.status}"
                 )
-            r_text = await resp.text()
-            soup = BeautifulSoup(r_text, features="lxml")
-
-            rss_last_update = datetime.strptime(
-                soup.rss.channel.lastbuilddate.text, "%a, %d %b %Y %H:%M:%S %z"
-            )
-            items = reversed(soup.rss.channel.find_all("item"))
-
-            if self._last_update is not None:
-                if self._last_update.timestamp() >= rss_last_update.timestamp():
-                    return
-
-            self._last_update = rss_last_update
+            etag = resp.headers.get("ETag")
+            last_modified = resp.headers.get("Last-Modified")
+            body = await resp.read()
 
-            task_num = 0
+        loop = asyncio.get_running_loop()
+        rss_last_update, ttl, updates = await loop.run_in_executor(
+            None, _parse_all_bills, body, self._last_update
+        )
+        if ttl is not None and ttl > 0:
+            self._poll_interval = max(_POLL_INTERVAL, min(ttl * 60, _MAX_POLL_INTERVAL))
+        if updates is None:
+            return
 
-            for item in items:
-                bill_id = item.guid.text.split("/")[-1]  # type: ignore
-                feed = None
-                if item.guid.text in [f.get_bill_url() for f in self._feeds]:
-                    feed = self.get_feed(bill_id)
-                else:
-                    feed = Feed(item.guid.text, self._session)
-                    self._feeds.append(feed)
+        polled = []
+        # The newest update polled per feed. Feed cursors only advance once the poll succeeds, so
+        # a failed poll is retried in full.
+        cursors: dict[Feed, datetime] = {}
+        for update in reversed(updates):
+            feed = self._feeds_by_url.get(update.get_guid())
+            if feed is None:
+                feed = Feed(update.get_guid(), self._session)
+                self._feeds_by_url[feed.get_bill_url()] = feed
+                self._feeds_by_id[feed.get_id()] = feed
+
+            if not self._listeners:
+                continue
+            update = await feed.process_poll_item(update)
+            if update is None:
+                continue
+            cursor = cursors.get(feed)
+            if cursor is not None and update._updated <= cursor:
+                continue
+            cursors[feed] = update._updated
+            if _update_key(update) not in self._seen_updates:
+                polled.append((feed, update))
 
-                if feed is None:
+        if len(polled) > 0:
+            stored = await self._storage.has_updates_stored(
+                [(feed.get_id(), update) for feed, update in polled]
+            )
+            dispatched = []
+            for (feed, update), is_stored in zip(polled, stored):
+                if is_stored is True:
+                    self._seen_updates[_update_key(update)] = True
                     continue
-                task_num += 1
-                tasks.append(self._poll_task(feed, item))
 
-        await asyncio.gather(*tasks)
+                update_mask = _update_mask(update)
+                listeners = [
+                    listener
+                    for listener in self._listeners
+                    if listener._mask & update_mask
+                ]
+                if len(listeners) > 0:
+                    dispatched.append((feed, update, listeners))
+
+            if len(dispatched) > 0:
+                # Stored before dispatching, so a listener can't cancel the write, and a failed
+                # write leaves the updates to be retried by the next poll.
+                await self._storage.add_feed_updates(
+                    [(feed.get_id(), update) for feed, update, _ in dispatched]
+                )
+                await asyncio.gather(
+                    *[
+                        self._poll_task(feed, update, listeners)
+                        for feed, update, listeners in dispatched
+                    ]
+                )
+                for _, update, _ in dispatched:
+                    self._seen_updates[_update_key(update)] = True
+        for feed, updated in cursors.items():
+            feed.last_update = updated
+        self._last_update = rss_last_update
+        self._etag = etag
+        self._last_modified = last_modified
         self.bills_first_polling = False
 
     def get_feeds(self):
-        return self._feeds
+        return self._feeds_by_url.values()
+
+
+async def _fetch_publications(
+    feed: Feed, semaphore: asyncio.Semaphore, update_limit: int
+) -> tuple[list[tuple[int, PublicationUpdate]], tuple]:
+    """
+    Fetches the newest publications of a feed, used by :class:`PublicationsTracker`.
+
+    Parameters
+    ----------
+    feed: :class:`Feed`
+        The feed of a bill.
+    semaphore: :class:`asyncio.Semaphore`
+        The semaphore bounding concurrent fetches.
+    update_limit: :class:`int`
+        The amount to fetch in new updates.
+
+    Returns
+    -------
+    A list of tuples of the bill id and each :class:`PublicationUpdate`, and the feed's new
+    cursor, which is only to be advanced once the updates have been stored.
+    """
+    async with semaphore:
+        updates, cursor = await feed._fetch_publications(update_limit)
+    return [(feed.get_id(), update) for update in updates], cursor
 
 
 class PublicationsTracker:
@@ -556,6 +1020,7 @@ class PublicationsTracker:
         tracker: BillsTracker,
         *,
         pffl: int = 10,
+        max_fetches: int = utils.MAX_CONNECTIONS_PER_HOST,
     ):
         """
         Publications tracker tracks publications of individual bills. There is often on publication for each bill.
@@ -568,11 +1033,16 @@ class PublicationsTracker:
             The bills tracker instance.
         pffl: :class:`int`
             The limit each tracker can poll of new updates.
+        max_fetches: :class:`int`
+            The amount of bill feeds fetched concurrently.
         """
         self._tracker = tracker
         self._last_polled = None
         self._load_per_feed_fetch_limit = pffl
         self._first_index = True
+        self._max_fetches = max_fetches
+        # Created on the first poll, on the loop the tracker runs on.
+        self._fetch_semaphore = None
         self.listeners = []
 
     def register(self, listener_func):
@@ -591,54 +1061,91 @@ class PublicationsTracker:
         """
         The main event loop.
         """
+        while True:
+            await self.poll()
+            await asyncio.sleep(_POLL_INTERVAL)
 
-        async def main():
-            await asyncio.ensure_future(self.poll())
-            await asyncio.sleep(30)
-            await main()
+    async def _dispatch(self, bill_id: int, update: PublicationUpdate):
+        """
+        Invokes the listeners with a publication update that has just been stored. A listener
+        that raises is logged, and doesn't stop the other listeners.
 
-        await main()
+        Parameters
+        ----------
+        bill_id: :class:`int`
+            The id of the bill the update was published for.
+        update: :class:`PublicationUpdate`
+            The publication update.
+        """
+        results = await asyncio.gather(
+            *[listener(update) for listener in self.listeners],
+            return_exceptions=True,
+        )
+        for listener, result in zip(self.listeners, results):
+            if isinstance(result, Exception):
+                _log.error(
+                    "Listener %r failed on publication %s of bill %s",
+                    listener,
+                    update.get_guid(),
+                    bill_id,
+                    exc_info=result,
+                )
 
     async def poll(self):
         """
         The main event loop function. Polls the publications of each feed.
         """
 
-        async def _task(update: PublicationUpdate, func):
-            await func(update)
-
-        fetch_tasks = []
-        tasks = []
-
-        for feed in self._tracker.get_feeds():
+        update_limit = (
+            self._load_per_feed_fetch_limit
+            if self._first_index
+            else _PUBLICATION_UPDATE_LIMIT
+        )
+        if self._fetch_semaphore is None:
+            self._fetch_semaphore = asyncio.Semaphore(self._max_fetches)
+        feeds = list(self._tracker.get_feeds())
+        fetch_tasks = [
+            _fetch_publications(feed, self._fetch_semaphore, update_limit)
+            for feed in feeds
+        ]
 
-            async def _fetch_task(feed: Feed):
-                updates = (
-                    await feed.fetch_newest_publications(
-                        self._load_per_feed_fetch_limit
-                    )
-                    if self._first_index
-                    else await feed.fetch_newest_publications()
+        self._last_polled = datetime.now()
+        results = await asyncio.gather(*fetch_tasks, return_exceptions=True)
+        # A feed that failed to fetch is logged and retried on the next poll, without losing the
+        # updates of the feeds that were fetched.
+        fetched = []
+        cursors = []
+        for feed, result in zip(feeds, results):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                _log.error(
+                    "Fetching publications of bill %s failed",
+                    feed.get_id(),
+                    exc_info=result,
                 )
+                continue
 
-                if len(updates) > 0:
-                    for update in updates:
-                        if await self._tracker.get_storage().has_publication_update(
-                            feed.get_id(), update
-                        ):
-                            continue
-
-                        await self._tracker.get_storage().add_publication_update(
-                            feed.get_id(), update
-                        )
-                        for listener in self.listeners:
-                            tasks.append(_task(update, listener))
-
-            fetch_tasks.append(_fetch_task(feed))
-
-        self._last_polled = datetime.now()
-        await asyncio.gather(*fetch_tasks)
-        await asyncio.gather(*tasks)
+            pairs, cursor = result
+            fetched.extend(pairs)
+            cursors.append((feed, cursor))
+        if len(fetched) > 0:
+            storage = self._tracker.get_storage()
+            stored = await storage.has_publication_updates(fetched)
+            new_updates = [
+                pair for pair, is_stored in zip(fetched, stored) if not is_stored
+            ]
+            # Stored before any listener sees them, so a failed write can't be redelivered.
+            await storage.add_publication_updates(new_updates)
+            await asyncio.gather(
+                *[
+                    self._dispatch(bill_id, update)
+                    for bill_id, update in new_updates
+                ]
+            )
+        # Only advanced now that every update fetched has been stored.
+        for feed, cursor in cursors:
+            feed._advance_publications(cursor)
         if self._first_index:
             self._first_index = False
 
@@ -648,11 +1155,7 @@ async def dual_event_loop(b_tracker: BillsTracker, p_tracker: PublicationsTracke
     Used in the event that both the :class:`BillsTracker` and :class:`PublicationsTracker` are
     instantiated in the main class.
     """
-
-    async def main():
+    while True:
         await b_tracker.poll()
         await p_tracker.poll()
-        await asyncio.sleep(30)
-        await main()
-
-    await main()
+        await asyncio.sleep(b_tracker.get_poll_interval())
@@ -1,7 +1,20 @@
 import asyncio
+import logging
+import random
+from threading import Lock
 from typing import Union
+
+from cachetools import LRUCache, TTLCache
+
 from ukparliament.bills import SearchBillsBuilder, SearchBillsSortOrder
-from .structures.bills import LordsDivision, CommonsDivision
+from . import utils
+from .structures.bills import Bill, LordsDivision, CommonsDivision
+
+_log = logging.getLogger(__name__)
+
+_NOT_CACHED = object()
+_SEEN_DIVISIONS_SIZE = 10_000
+_POLL_RESULT_LIMIT = 10
 
 
 class DivisionStorage:
@@ -54,6 +67,26 @@ class DivisionStorage:
         """
         return False
 
+    async def division_stored_by_id(self, division_id: int, lords: bool) -> bool:
+        """
+        Check if a division is stored, by its id. Checked by :class:`DivisionsTracker` before the
+        division is fetched, so divisions that are already stored don't cost a request. By default
+        this returns False, leaving the check to :meth:`division_stored` once the division has been
+        fetched.
+
+        Parameters
+        ----------
+        division_id: :class:`int`
+            The id of the division.
+        lords: :class:`bool`
+            True if the division is a Lords division, False if it is a Commons division.
+
+        Returns
+        -------
+        A :class:`bool` True if stored, else False.
+        """
+        return False
+
     async def bill_division_stored(
         self, bill_id: int, division: Union[LordsDivision, CommonsDivision]
     ) -> bool:
@@ -92,7 +125,13 @@ class DivisionStorage:
 
 
 class DivisionsTracker:
-    def __init__(self, parliament, storage: DivisionStorage):
+    def __init__(
+        self,
+        parliament,
+        storage: DivisionStorage,
+        interval: float = 30.0,
+        jitter: float = 0.1,
+    ):
         """
         DivisionsTracker tracks divisions from both the House of Lords and the House of Commons by
         repeatedly searching for the most recently added divisions on the REST API every 30 seconds.
@@ -105,13 +144,27 @@ class DivisionsTracker:
             An instance of the main class, used to fetch the most recently added divisions.
         storage: :class:`DivisionStorage`
             The storage interface the tracker will use.
+        interval: :class:`float`
+            The number of seconds between polls. Intervals below ~15ms aren't honoured on Windows,
+            where that is the resolution of asyncio.sleep.
+        jitter: :class:`float`
+            The fraction the interval is randomly varied by, so trackers started at the same time
+            don't poll the REST API in lockstep.
         """
         self.parliament = parliament
+        self._interval = interval
+        self._jitter = jitter
         self.lords_listeners = []
         self.commons_listeners = []
         self.last_update = None
         self.storage = storage
-        pass
+        self.bill_cache = TTLCache(maxsize=512, ttl=3600)
+        self.bill_cache_lock = Lock()
+        self._bill_inflight: dict[str, asyncio.Future] = {}
+        self._search_url_cache = LRUCache(maxsize=512)
+        self._seen_divisions = LRUCache(maxsize=_SEEN_DIVISIONS_SIZE)
+        # The ETag and Last-Modified of the last fully processed poll, keyed by lords_division.
+        self._validators: dict[bool, tuple[Union[str, None], Union[str, None]]] = {}
 
     def register(self, func, commons_listener: bool = True):
         """
@@ -132,16 +185,86 @@ class DivisionsTracker:
 
     async def start_event_loop(self):
         """
-        Starts the event loop.
+        Starts the event loop. A failed poll of one house doesn't cancel the poll of the other,
+        the failure is logged and the loop carries on polling.
+        """
+        while True:
+            results = await asyncio.gather(
+                self.poll_commons(), self.poll_lords(), return_exceptions=True
+            )
+            for house, result in zip(("Commons", "Lords"), results):
+                if isinstance(result, asyncio.CancelledError):
+                    raise result
+                if isinstance(result, BaseException):
+                    _log.error("Polling %s divisions failed", house, exc_info=result)
+            await asyncio.sleep(
+                self._interval * (1 + random.uniform(-self._jitter, self._jitter))
+            )
+
+    async def _find_bill(self, bill_section: str) -> Union[Bill, None]:
+        """
+        Finds the bill a division title refers to. Bill titles rarely change, so results (including
+        not finding a bill) are cached for an hour, and concurrent lookups of the same title share
+        a single search.
+
+        Parameters
+        ----------
+        bill_section: :class:`str`
+            The part of the division title up to and including 'Bill'.
+
+        Returns
+        -------
+        A :class:`Bill` whose title starts with 'bill_section', or None.
+        """
+        with self.bill_cache_lock:
+            bill = self.bill_cache.get(bill_section, _NOT_CACHED)
+        if bill is not _NOT_CACHED:
+            return bill
+
+        inflight = self._bill_inflight.get(bill_section)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._search_bill(bill_section))
+            self._bill_inflight[bill_section] = inflight
+            inflight.add_done_callback(
+                lambda _: self._bill_inflight.pop(bill_section, None)
+            )
+        # Shielded so a cancelled caller doesn't cancel the search for the other callers.
+        return await asyncio.shield(inflight)
+
+    async def _search_bill(self, bill_section: str) -> Union[Bill, None]:
+        """
+        Searches for the bill a division title refers to and caches the result.
+
+        Parameters
+        ----------
+        bill_section: :class:`str`
+            The part of the division title up to and including 'Bill'.
+
+        Returns
+        -------
+        A :class:`Bill` whose title starts with 'bill_section', or None.
         """
+        # The search url only depends on the title, so it outlives the cached result.
+        url = self._search_url_cache.get(bill_section)
+        if url is None:
+            url = (
+                SearchBillsBuilder.builder()
+                .set_search_term(bill_section)
+                .set_sort_order(SearchBillsSortOrder.TITLE_DESENCING)
+                .build()
+            )
+            self._search_url_cache[bill_section] = url
 
-        async def main():
-            asyncio.ensure_future(self.poll_commons())
-            asyncio.ensure_future(self.poll_lords())
-            await asyncio.sleep(30)
-            await main()
+        bills = await self.parliament.search_bills(url=url)
+        # Results are sorted by title descending and the last match has always been the one
+        # used, so walk them backwards and stop at the first match.
+        bill = next(
+            (b for b in reversed(bills) if b.get_title().startswith(bill_section)), None
+        )
 
-        await main()
+        with self.bill_cache_lock:
+            self.bill_cache[bill_section] = bill
+        return bill
 
     async def division_task(self, division_id: int, lords_division: bool = False):
         """
@@ -156,6 +279,16 @@ class DivisionsTracker:
         lords_division: :class:`bool`
             A boolean that determines if the new division is a Lords or Commons division.
         """
+        # Once a division is known to be stored it stays stored, so later polls answer it
+        # locally instead of asking the storage medium again.
+        seen_key = (lords_division, division_id)
+        if seen_key in self._seen_divisions:
+            return
+
+        if await self.storage.division_stored_by_id(division_id, lords_division):
+            self._seen_divisions[seen_key] = True
+            return
+
         division = (
             await self.parliament.get_lords_division(division_id)
             if lords_division
@@ -163,27 +296,19 @@ class DivisionsTracker:
         )
         has_been_stored = await self.storage.division_stored(division)
         if has_been_stored:
+            self._seen_divisions[seen_key] = True
             return
-        title = division.get_division_title()
+        head, sep, _ = division.get_division_title().partition("Bill")
         bill = None
-        if "Bill" in title:
-            bill_section = title.split("Bill")[0] + "Bill"
-            bills = await self.parliament.search_bills(
-                url=SearchBillsBuilder.builder()
-                .set_search_term(bill_section)
-                .set_sort_order(SearchBillsSortOrder.TITLE_DESENCING)
-                .build()
-            )
-            if len(bills) > 0:
-                for b in bills:
-                    if b.get_title().startswith(bill_section):
-                        bill = b
+        if sep:
+            bill = await self._find_bill(head + sep)
 
         if bill is not None:
             has_been_stored_b = await self.storage.bill_division_stored(
                 bill.get_bill_id(), division
             )
             if has_been_stored_b:
+                self._seen_divisions[seen_key] = True
                 return
 
         if bill is not None:
@@ -191,38 +316,111 @@ class DivisionsTracker:
         else:
             await self.storage.add_division(division)
 
-        listener_tasks = []
+        listeners = self.lords_listeners if lords_division else self.commons_listeners
+        if listeners:
+            # Each listener is isolated, a failing one is logged and doesn't stop the others.
+            results = await asyncio.gather(
+                *[listener(division, bill) for listener in listeners],
+                return_exceptions=True,
+            )
+            for listener, result in zip(listeners, results):
+                if isinstance(result, Exception):
+                    _log.error(
+                        "Listener %r failed on division %s",
+                        listener,
+                        division_id,
+                        exc_info=result,
+                    )
+        self._seen_divisions[seen_key] = True
+
+    async def _process_divisions(self, division_ids: list[int], lords_division: bool):
+        """
+        Processes the divisions of a poll. A division that fails doesn't cancel the others, the
+        first failure is raised once they have all finished.
 
-        for listener in (
-            self.lords_listeners
-            if isinstance(division, LordsDivision)
-            else self.commons_listeners
-        ):
-            listener_tasks.append(listener(division, bill))
+        Parameters
+        ----------
+        division_ids: :class:`list[int]`
+            The ids of the divisions.
+        lords_division: :class:`bool`
+            A boolean that determines if the divisions are Lords or Commons divisions.
+        """
+        results = await asyncio.gather(
+            *[
+                self.division_task(division_id, lords_division)
+                for division_id in division_ids
+            ],
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    async def _poll_division_ids(self, lords_division: bool):
+        """
+        Fetches the ids of the most recently added divisions of a house. Only the ids are needed
+        to process a division, so the search results aren't turned into populated divisions. The
+        search is requested conditionally, so when nothing has changed since the last processed
+        poll the API can answer with an empty 304.
+
+        Parameters
+        ----------
+        lords_division: :class:`bool`
+            A boolean that determines if the Lords or Commons divisions are searched.
 
-        await asyncio.gather(*listener_tasks)
+        Returns
+        -------
+        A :class:`tuple` of the division ids, or None if nothing has changed, and the ETag and
+        Last-Modified of the response.
+        """
+        if lords_division:
+            url = (
+                f"{utils.URL_LORDS_VOTES}/Divisions/search"
+                f"?skip=0&take={_POLL_RESULT_LIMIT}"
+            )
+            id_key = "divisionId"
+        else:
+            url = (
+                f"{utils.URL_COMMONS_VOTES}/divisions.json/search"
+                f"?queryParameters.skip=0&queryParameters.take={_POLL_RESULT_LIMIT}"
+            )
+            id_key = "DivisionId"
+
+        etag, last_modified = self._validators.get(lords_division, (None, None))
+        async with self.parliament.session.get(
+            url, headers=utils.conditional_headers(etag, last_modified)
+        ) as resp:
+            if resp.status == 304:
+                return None, etag, last_modified
+
+            if resp.status != 200:
+                raise Exception(
+                    f"Couldn't fetch the latest divisions from {url}. Status Code: {resp.status}"
+                )
+            etag = resp.headers.get("ETag")
+            last_modified = resp.headers.get("Last-Modified")
+            content = await utils.read_json(resp)
+        return [item[id_key] for item in content], etag, last_modified
 
     async def poll_commons(self):
         """
         A main event loop function, used to poll commons divisions.
         """
-        divisions = await self.parliament.search_for_commons_divisions(result_limit=10)
+        division_ids, etag, last_modified = await self._poll_division_ids(False)
+        if division_ids is None:
+            return
 
-        tasks = []
-        for division in divisions:
-            tasks.append(self.division_task(division.get_id(), False))
-        await asyncio.gather(*tasks)
+        await self._process_divisions(division_ids, False)
+        self._validators[False] = etag, last_modified
 
     async def poll_lords(self):
         """
         A main event loop function, used to poll lords divisions.
         """
-        divisions: list[
-            LordsDivision
-        ] = await self.parliament.search_for_lords_divisions(result_limit=10)
-        divisions.reverse()
+        division_ids, etag, last_modified = await self._poll_division_ids(True)
+        if division_ids is None:
+            return
+        division_ids.reverse()
 
-        tasks = []
-        for division in divisions:
-            tasks.append(self.division_task(division.get_id(), True))
-        await asyncio.gather(*tasks)
+        await self._process_divisions(division_ids, True)
+        self._validators[True] = etag, last_modified
@@ -3,10 +3,55 @@ import aiohttp
 from .structures.members import PartyMember, ElectionResult, VotingEntry
 from cachetools import TTLCache
 from threading import Lock
+from typing import Union
 from . import utils
 
+MAX_ELECTION_RESULT_FETCHES = 8
 
-async def er_task(er_member: PartyMember, session: aiohttp.ClientSession):
+
+async def election_result_task(
+    session: aiohttp.ClientSession,
+    borough_id: int,
+    election_id: int,
+    semaphore: asyncio.Semaphore,
+) -> ElectionResult:
+    """
+    A task used to fetch a single election result of a constituency.
+
+    Parameters
+    ----------
+    session: :class:`ClientSession`
+        A aiohttp client session.
+    borough_id: :class:`int`
+        The id of the constituency.
+    election_id: :class:`int`
+        The id of the election.
+    semaphore: :class:`asyncio.Semaphore`
+        The semaphore bounding concurrent election result fetches.
+
+    Returns
+    -------
+    An :class:`ElectionResult` instance.
+    """
+    async with semaphore:
+        async with session.get(
+            f"{utils.URL_MEMBERS}/Location/Constituency/{borough_id}/ElectionResult/"
+            f"{election_id}"
+        ) as election_resp:
+            if election_resp.status != 200:
+                raise Exception(
+                    f"Couldn't fetch election result {election_id}. "
+                    f"Status Code: {election_resp.status}"
+                )
+            content = await utils.read_json(election_resp)
+    return ElectionResult(content["value"])
+
+
+async def er_task(
+    er_member: PartyMember,
+    session: aiohttp.ClientSession,
+    semaphore: Union[asyncio.Semaphore, None] = None,
+):
     """
     A task used to fetch election results for each member.
 
@@ -16,14 +61,20 @@ async def er_task(er_member: PartyMember, session: aiohttp.ClientSession):
         The member who represents a constituency (MP).
     session: :class:`ClientSession`
         A aiohttp client session.
+    semaphore: :class:`asyncio.Semaphore`
+        The semaphore bounding concurrent election result fetches. If none is provided, the
+        fetches of this member are bounded to MAX_ELECTION_RESULT_FETCHES.
 
     Returns
     -------
     A list of :class:`ElectionResult` instances for the :class:`PartyMember` specified.
     """
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(MAX_ELECTION_RESULT_FETCHES)
+
+    borough_id = er_member._get_membership_from_id()
     async with session.get(
-        f"{utils.URL_MEMBERS}/Location/Constituency/{er_member._get_membership_from_id()}"
-        "/ElectionResults"
+        f"{utils.URL_MEMBERS}/Location/Constituency/{borough_id}/ElectionResults"
     ) as elections_resp:
         if elections_resp.status != 200:
             raise Exception(
@@ -31,36 +82,17 @@ async def er_task(er_member: PartyMember, session: aiohttp.ClientSession):
                 f"{er_member.get_id()}. Status Code: {elections_resp.status}"
             )
 
-        elections_obj = await elections_resp.json()
-
-        async def inner_task(
-            session: aiohttp.ClientSession, borough_id: int, election_id: int
-        ):
-            async with session.get(
-                f"{utils.URL_MEMBERS}/Location/Constituency/{borough_id}/ElectionResult/"
-                f"{election_id}"
-            ) as election_resp:
-                if election_resp.status != 200:
-                    raise Exception(
-                        f"Couldn't fetch election result {election_id}. "
-                        f"Status Code: {election_resp.status}"
-                    )
-                content = await election_resp.json()
-                result = ElectionResult(content["value"])
-                return result
-
-        election_tasks = []
-
-        for election_json_obj in elections_obj["value"]:
-            election_tasks.append(
-                inner_task(
-                    session,
-                    er_member._get_membership_from_id(),
-                    election_json_obj["electionId"],
-                )
+        elections_obj = await utils.read_json(elections_resp)
+
+    elections = await utils.gather_tasks(
+        *[
+            election_result_task(
+                session, borough_id, election_json_obj["electionId"], semaphore
             )
-        elections = await asyncio.gather(*election_tasks)
-        return elections
+            for election_json_obj in elections_obj["value"]
+        ]
+    )
+    return elections
 
 
 async def vh_task(
@@ -79,16 +111,17 @@ async def vh_task(
         The voting history cache, used to fetch history entries in the near future.
     lock: :class:`Lock`
         The cache lock for the voting history cache.
-    """
-    url = f"{utils.URL_MEMBERS}/Members/{vi_member.get_id()}/Voting?house="
-    f'{"Commons" if vi_member.is_mp() is True else "Lords"}'
-    items = await utils.load_data(url, session)
-
-    voting_list = []
 
-    for item in items:
-        entry = VotingEntry(item)
-        voting_list.append(entry)
+    Returns
+    -------
+    A list of :class:`VotingEntry` instances for the :class:`PartyMember` specified.
+    """
+    url = (
+        f"{utils.URL_MEMBERS}/Members/{vi_member.get_id()}/Voting?house="
+        f'{"Commons" if vi_member.is_mp() is True else "Lords"}'
+    )
+    voting_list = await utils.load_data(url, session, item_factory=VotingEntry)
 
     with lock:
         cache[vi_member.get_id()] = voting_list
+    return voting_list
@@ -1,10 +1,81 @@
 import datetime
-import json
-from typing import Union
+import re
+import sys
+from array import array
+from functools import lru_cache
+from operator import itemgetter
+from typing import Sequence, Union
 from ..structures.members import PartyMember
 
+_lords_member_id = itemgetter("memberId")
+_commons_member_id = itemgetter("MemberId")
+_NOTES_MARKUP = re.compile(r"</?(?:p|em)>|<br />")
+
+
+def _intern(value):
+    """
+    Interns a low cardinality string, such as a house or category name, so that every
+    instance shares the one string object. Anything that isn't a string is returned as is.
+
+    Parameters
+    ----------
+    value: :class:`object`
+        The value to intern.
+
+    Returns
+    -------
+    The interned string, or the value.
+    """
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _member_ids(id_getter: itemgetter, entries: list) -> array:
+    """
+    Packs the member ids of a division's voters into a C int array, which takes a tenth of
+    the memory of a list of boxed ints for divisions with hundreds of voters.
+
+    Parameters
+    ----------
+    id_getter: :class:`itemgetter`
+        Gets the member id of an entry.
+    entries: :class:`list`
+        The JSON serialized voters.
+
+    Returns
+    -------
+    An :class:`array` of member ids.
+    """
+    return array("i", list(map(id_getter, entries)))
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(date_string: str) -> datetime.datetime:
+    """
+    Parses an ISO-8601 date. Division and bill dates recur heavily across a search, so
+    results are memoized.
+
+    Parameters
+    ----------
+    date_string: :class:`str`
+        The date, e.g. '2021-11-10T16:00:00'.
+
+    Returns
+    -------
+    A :class:`datetime`.
+    """
+    return datetime.datetime.fromisoformat(date_string)
+
 
 class BillStage:
+    __slots__ = (
+        "_stage_id",
+        "_name",
+        "_order",
+        "_category_stage",
+        "_prominent_order",
+        "_house",
+    )
+
     def __init__(self, json_object):
         """
         A bill stage is a stage in the legislative process that a bill will likely have to go through
@@ -21,7 +92,7 @@ class BillStage:
             json_object["sortOrder"] if "sortOrder" in json_object.keys() else ""
         )
         self._category_stage = (
-            json_object["stageCategory"]
+            _intern(json_object["stageCategory"])
             if "stageCategory" in json_object.keys()
             else ""
         )
@@ -30,7 +101,7 @@ class BillStage:
             if "prominentSortOrder" in json_object.keys()
             else -1
         )
-        self._house = json_object["house"]
+        self._house = _intern(json_object["house"])
 
     def get_stage_id(self) -> int:
         """
@@ -71,6 +142,14 @@ class BillStage:
 
 
 class BillType:
+    __slots__ = (
+        "_bill_type_id",
+        "_category",
+        "_name",
+        "_description",
+        "_order",
+    )
+
     def __init__(self, json_object):
         """
         A class representing a bill type.
@@ -81,7 +160,7 @@ class BillType:
             A JSON serialized bill type.
         """
         self._bill_type_id = json_object["id"]
-        self._category = json_object["category"]
+        self._category = _intern(json_object["category"])
         self._name = json_object["name"]
         self._description = json_object["description"]
         self._order = json_object["order"] if "order" in json_object.keys() else -1
@@ -118,6 +197,27 @@ class BillType:
 
 
 class Bill:
+    __slots__ = (
+        "_bill_id",
+        "_title",
+        "_current_house",
+        "_originating_house",
+        "_last_update",
+        "_defeated",
+        "_withdrawn",
+        "_bill_type_id",
+        "_sessions",
+        "_current_stage_id",
+        "_stage_sittings",
+        "_royal_assent",
+        "_act",
+        "_sponsors",
+        "_session_introduced",
+        "_long_title",
+        "_bill_type",
+        "_current_stage",
+    )
+
     def __init__(self, json_object):
         """
         A bill is a piece of legislation that is introduced, and 'processed' through the Houses of Parliament.
@@ -133,17 +233,11 @@ class Bill:
         )
         self._bill_id = value_object["billId"]
         self._title = value_object["shortTitle"]
-        self._current_house = value_object["currentHouse"]
-        self._originating_house = value_object["originatingHouse"]
-        self._last_update = datetime.datetime.strptime(
-            value_object["lastUpdate"].split(".")[0], "%Y-%m-%dT%H:%M:%S"
-        )
+        self._current_house = _intern(value_object["currentHouse"])
+        self._originating_house = _intern(value_object["originatingHouse"])
+        self._last_update = _parse_iso(value_object["lastUpdate"].split(".")[0])
         self._defeated = value_object["isDefeated"]
-        self._withdrawn = (
-            value_object["billWithdrawn"]
-            if value_object["billWithdrawn"] is not None
-            else False
-        )
+        self._withdrawn = value_object.get("billWithdrawn") or False
         self._bill_type_id = value_object["billTypeId"]
         self._sessions = value_object["includedSessionIds"]
         self._current_stage_id = value_object["currentStage"]["stageId"]
@@ -152,6 +246,86 @@ class Bill:
         self._act = value_object["isAct"]
         self._sponsors: list[PartyMember] = []
         self._session_introduced = value_object["introducedSessionId"]
+        self._long_title: Union[str, None] = None
+        self._bill_type: Union[BillType, None] = None
+        self._current_stage: Union[BillStage, None] = None
+
+    @classmethod
+    def from_fields(
+        cls,
+        *,
+        bill_id: int,
+        title: str,
+        current_house: str,
+        originating_house: str,
+        last_update: datetime.datetime,
+        defeated: bool,
+        withdrawn,
+        bill_type_id: int,
+        sessions: list,
+        current_stage_id: int,
+        stage_sittings: list,
+        act: bool,
+        session_introduced: int,
+    ):
+        """
+        Creates a bill straight from its fields, e.g. when rehydrating a bill from a local cache,
+        skipping the JSON object lookups of the constructor. The long title, sponsors, bill type
+        and current stage are left unset, as they are with the constructor.
+
+        Parameters
+        ----------
+        bill_id: :class:`int`
+            The bill id.
+        title: :class:`str`
+            The short form title of the bill.
+        current_house: :class:`str`
+            The house the bill is currently in.
+        originating_house: :class:`str`
+            The house the bill was introduced in.
+        last_update: :class:`datetime`
+            The last update to the bill.
+        defeated: :class:`bool`
+            If the bill was defeated.
+        withdrawn: :class:`object`
+            If, or when, the bill was withdrawn.
+        bill_type_id: :class:`int`
+            The id of the bill's type.
+        sessions: :class:`list`
+            The ids of the sessions the bill has been in.
+        current_stage_id: :class:`int`
+            The id of the bill's current stage.
+        stage_sittings: :class:`list`
+            The sittings of the bill's current stage.
+        act: :class:`bool`
+            If the bill is an act.
+        session_introduced: :class:`int`
+            The id of the session the bill was introduced in.
+
+        Returns
+        -------
+        A :class:`Bill` instance.
+        """
+        bill = cls.__new__(cls)
+        bill._bill_id = bill_id
+        bill._title = title
+        bill._current_house = _intern(current_house)
+        bill._originating_house = _intern(originating_house)
+        bill._last_update = last_update
+        bill._defeated = defeated
+        bill._withdrawn = withdrawn
+        bill._bill_type_id = bill_type_id
+        bill._sessions = sessions
+        bill._current_stage_id = current_stage_id
+        bill._stage_sittings = stage_sittings
+        bill._royal_assent = current_stage_id == 11
+        bill._act = act
+        bill._sponsors = []
+        bill._session_introduced = session_introduced
+        bill._long_title = None
+        bill._bill_type = None
+        bill._current_stage = None
+        return bill
 
     def get_session_introduced_id(self) -> int:
         """
@@ -294,6 +468,33 @@ class Bill:
 
 
 class LordsDivision:
+    __slots__ = (
+        "_division_id",
+        "_date",
+        "_division_number",
+        "_notes",
+        "_title",
+        "_whipped",
+        "_gov_content",
+        "_aye_votes",
+        "_no_votes",
+        "_sponsoring_member_id",
+        "_is_house",
+        "_amendment_motion_notes",
+        "_gov_won",
+        "_remote_voting_start",
+        "_remote_voting_end",
+        "_aye_teller_ids",
+        "_no_teller_ids",
+        "_aye_member_ids",
+        "_no_member_ids",
+        "_aye_tellers",
+        "_no_tellers",
+        "_aye_members",
+        "_no_members",
+        "_sponsoring_member",
+    )
+
     def __init__(self, json_object):
         """
         A lords division is a vote upon a motion, bill, amendment, &c in the House of Lords.
@@ -305,7 +506,7 @@ class LordsDivision:
             The JSON serialized division object.
         """
         self._division_id = json_object["divisionId"]
-        self._date = datetime.datetime.fromisoformat(json_object["date"])
+        self._date = _parse_iso(json_object["date"])
         self._division_number = json_object["number"]
         self._notes = json_object["notes"]
         self._title = json_object["title"]
@@ -320,42 +521,131 @@ class LordsDivision:
             self._amendment_motion_notes is not None
             and self._amendment_motion_notes != ""
         ):
-            self._amendment_motion_notes = (
-                self._amendment_motion_notes.replace("<p>", "")
-                .replace("</p>", "")
-                .replace("<em>", "")
-                .replace("<br />", "")
-                .replace("</em>", "")
+            self._amendment_motion_notes = _NOTES_MARKUP.sub(
+                "", self._amendment_motion_notes
             )
         self._gov_won = json_object["isGovernmentWin"]
         self._remote_voting_start = (
-            datetime.datetime.fromisoformat(json_object["remoteVotingStart"])
-            if json_object["remoteVotingStart"] is not None
-            else None
+            _parse_iso(start) if (start := json_object["remoteVotingStart"]) else None
         )
         self._remote_voting_end = (
-            datetime.datetime.fromisoformat(json_object["remoteVotingEnd"])
-            if json_object["remoteVotingEnd"] is not None
-            else None
+            _parse_iso(end) if (end := json_object["remoteVotingEnd"]) else None
         )
         self._aye_teller_ids = list(
-            map(lambda teller: teller["memberId"], json_object["contentTellers"])
+            map(_lords_member_id, json_object["contentTellers"])
         )
         self._no_teller_ids = list(
-            map(lambda teller: teller["memberId"], json_object["notContentTellers"])
-        )
-        self._aye_member_ids = list(
-            map(lambda lord: lord["memberId"], json_object["contents"])
+            map(_lords_member_id, json_object["notContentTellers"])
         )
-        self._no_member_ids = list(
-            map(lambda lord: lord["memberId"], json_object["notContents"])
-        )
-        self._aye_tellers: list[PartyMember] = []
-        self._no_tellers: list[PartyMember] = []
-        self._aye_members: list[PartyMember] = []
-        self._no_members: list[PartyMember] = []
+        self._aye_member_ids = _member_ids(_lords_member_id, json_object["contents"])
+        self._no_member_ids = _member_ids(_lords_member_id, json_object["notContents"])
+        self._aye_tellers: Union[list[PartyMember], None] = None
+        self._no_tellers: Union[list[PartyMember], None] = None
+        self._aye_members: Union[list[PartyMember], None] = None
+        self._no_members: Union[list[PartyMember], None] = None
         self._sponsoring_member: Union[PartyMember, None] = None
 
+    @classmethod
+    def from_fields(
+        cls,
+        *,
+        division_id: int,
+        date: datetime.datetime,
+        division_number: int,
+        notes,
+        title: str,
+        whipped: bool,
+        gov_content: bool,
+        aye_count: int,
+        no_count: int,
+        sponsoring_member_id: int,
+        is_house: bool,
+        amendment_motion_notes: Union[str, None],
+        gov_won: bool,
+        remote_voting_start: Union[datetime.datetime, None] = None,
+        remote_voting_end: Union[datetime.datetime, None] = None,
+        aye_teller_ids: Sequence[int] = (),
+        no_teller_ids: Sequence[int] = (),
+        aye_member_ids: Sequence[int] = (),
+        no_member_ids: Sequence[int] = (),
+    ):
+        """
+        Creates a lords division straight from its fields, e.g. when rehydrating a division from
+        a local cache, skipping the JSON object lookups of the constructor. The members and
+        tellers are left unpopulated, as they are with the constructor.
+
+        Parameters
+        ----------
+        division_id: :class:`int`
+            The division id.
+        date: :class:`datetime`
+            The date the division was taken.
+        division_number: :class:`int`
+            The division number.
+        notes: :class:`object`
+            The notes of the division.
+        title: :class:`str`
+            The division title.
+        whipped: :class:`bool`
+            If the division was whipped.
+        gov_content: :class:`bool`
+            If the division was for Government content.
+        aye_count: :class:`int`
+            The total of members who voted yes.
+        no_count: :class:`int`
+            The total of members who voted no.
+        sponsoring_member_id: :class:`int`
+            The id of the sponsoring member.
+        is_house: :class:`bool`
+            The isHouse field of the division.
+        amendment_motion_notes: :class:`str`
+            The motion notes, already stripped of markup.
+        gov_won: :class:`bool`
+            If the Government won the division.
+        remote_voting_start: :class:`datetime`
+            When the remote voting count started, if any.
+        remote_voting_end: :class:`datetime`
+            When the remote voting count ended, if any.
+        aye_teller_ids: :class:`Sequence[int]`
+            The ids of the Tellers for the Yes vote.
+        no_teller_ids: :class:`Sequence[int]`
+            The ids of the Tellers for the No vote.
+        aye_member_ids: :class:`Sequence[int]`
+            The ids of the members who voted Yes.
+        no_member_ids: :class:`Sequence[int]`
+            The ids of the members who voted No.
+
+        Returns
+        -------
+        A :class:`LordsDivision` instance.
+        """
+        division = cls.__new__(cls)
+        division._division_id = division_id
+        division._date = date
+        division._division_number = division_number
+        division._notes = notes
+        division._title = title
+        division._whipped = whipped
+        division._gov_content = gov_content
+        division._aye_votes = aye_count
+        division._no_votes = no_count
+        division._sponsoring_member_id = sponsoring_member_id
+        division._is_house = is_house
+        division._amendment_motion_notes = amendment_motion_notes
+        division._gov_won = gov_won
+        division._remote_voting_start = remote_voting_start
+        division._remote_voting_end = remote_voting_end
+        division._aye_teller_ids = list(aye_teller_ids)
+        division._no_teller_ids = list(no_teller_ids)
+        division._aye_member_ids = array("i", aye_member_ids)
+        division._no_member_ids = array("i", no_member_ids)
+        division._aye_tellers = None
+        division._no_tellers = None
+        division._aye_members = None
+        division._no_members = None
+        division._sponsoring_member = None
+        return division
+
     def get_id(self) -> int:
         """
         Returns the division id.
@@ -420,7 +710,7 @@ class LordsDivision:
         """
         Unsure.
         """
-        return self._is_house()
+        return self._is_house
 
     def did_government_win(self) -> bool:
         """
@@ -444,25 +734,25 @@ class LordsDivision:
         """
         Returns a list of :class:`PartyMember` instances who were Tellers for the Yes votes.
         """
-        return self._aye_tellers
+        return self._aye_tellers or []
 
     def get_no_tellers(self) -> list[PartyMember]:
         """
         Returns a list of :class:`PartyMember` instances who were Tellers for the No votes.
         """
-        return self._no_tellers
+        return self._no_tellers or []
 
     def get_aye_members(self) -> list[PartyMember]:
         """
         Returns a list of :class:`PartyMember` instances who voted Yes.
         """
-        return self._aye_members
+        return self._aye_members or []
 
     def get_no_members(self) -> list[PartyMember]:
         """
         Returns a list of :class:`PartyMember` instances for voted No.
         """
-        return self._no_members
+        return self._no_members or []
 
     def get_aye_teller_ids(self) -> list[int]:
         """
@@ -476,15 +766,15 @@ class LordsDivision:
         """
         return self._no_teller_ids
 
-    def get_no_vote_member_ids(self) -> list[int]:
+    def get_no_vote_member_ids(self) -> Sequence[int]:
         """
-        Returns a list of :class:`int` associated with the members who voted No.
+        Returns an :class:`array` of :class:`int` associated with the members who voted No.
         """
         return self._no_member_ids
 
-    def get_aye_vote_member_ids(self) -> list[int]:
+    def get_aye_vote_member_ids(self) -> Sequence[int]:
         """
-        Returns a list of :class:`int` associated with the members who voted Yes.
+        Returns an :class:`array` of :class:`int` associated with the members who voted Yes.
         """
         return self._aye_member_ids
 
@@ -551,6 +841,31 @@ class LordsDivision:
 
 
 class CommonsDivision:
+    __slots__ = (
+        "_division_id",
+        "_date",
+        "_publiciation_uploaded",
+        "_number",
+        "_deferred",
+        "_evel_type",
+        "_evel_country",
+        "_title",
+        "_aye_count",
+        "_no_count",
+        "_double_majority_aye_count",
+        "_double_majority_no_count",
+        "_aye_teller_ids",
+        "_no_teller_ids",
+        "_aye_ids",
+        "_no_ids",
+        "_no_vote_ids",
+        "_ayes_members",
+        "_noes_members",
+        "_didnt_vote",
+        "_aye_tellers",
+        "_no_tellers",
+    )
+
     def __init__(self, json_object):
         """
         A commons division is a vote upon a motion, bill, amendment, &c in the House of Commons.
@@ -562,14 +877,12 @@ class CommonsDivision:
             The JSON serialized division object.
         """
         self._division_id = json_object["DivisionId"]
-        self._date = datetime.datetime.fromisoformat(json_object["Date"])
-        self._publiciation_uploaded = datetime.datetime.fromisoformat(
-            json_object["PublicationUpdated"]
-        )
+        self._date = _parse_iso(json_object["Date"])
+        self._publiciation_uploaded = _parse_iso(json_object["PublicationUpdated"])
         self._number = json_object["Number"]
         self._deferred = json_object["IsDeferred"]
-        self._evel_type = json_object["EVELType"]
-        self._evel_country = json_object["EVELCountry"]
+        self._evel_type = _intern(json_object["EVELType"])
+        self._evel_country = _intern(json_object["EVELCountry"])
         self._title = json_object["Title"]
         self._aye_count = json_object["AyeCount"]
         self._no_count = json_object["NoCount"]
@@ -578,33 +891,116 @@ class CommonsDivision:
         self._aye_teller_ids = (
             []
             if json_object["AyeTellers"] is None
-            else list(
-                map(
-                    lambda teller_object: teller_object["MemberId"],
-                    json_object["AyeTellers"],
-                )
-            )
+            else list(map(_commons_member_id, json_object["AyeTellers"]))
         )
         self._no_teller_ids = (
             []
             if json_object["NoTellers"] is None
-            else list(
-                map(
-                    lambda teller_object: teller_object["MemberId"],
-                    json_object["NoTellers"],
-                )
-            )
+            else list(map(_commons_member_id, json_object["NoTellers"]))
         )
-        self._aye_ids = list(map(lambda mp: mp["MemberId"], json_object["Ayes"]))
-        self._no_ids = list(map(lambda mp: mp["MemberId"], json_object["Noes"]))
-        self._no_vote_ids = list(
-            map(lambda mp: mp["MemberId"], json_object["NoVoteRecorded"])
+        self._aye_ids = _member_ids(_commons_member_id, json_object["Ayes"])
+        self._no_ids = _member_ids(_commons_member_id, json_object["Noes"])
+        self._no_vote_ids = _member_ids(
+            _commons_member_id, json_object["NoVoteRecorded"]
         )
-        self._ayes_members: list[PartyMember] = []
-        self._noes_members: list[PartyMember] = []
-        self._didnt_vote: list[PartyMember] = []
-        self._aye_tellers: list[PartyMember] = []
-        self._no_tellers: list[PartyMember] = []
+        self._ayes_members: Union[list[PartyMember], None] = None
+        self._noes_members: Union[list[PartyMember], None] = None
+        self._didnt_vote: Union[list[PartyMember], None] = None
+        self._aye_tellers: Union[list[PartyMember], None] = None
+        self._no_tellers: Union[list[PartyMember], None] = None
+
+    @classmethod
+    def from_fields(
+        cls,
+        *,
+        division_id: int,
+        date: datetime.datetime,
+        publication_uploaded: datetime.datetime,
+        number: int,
+        deferred: bool,
+        evel_type,
+        evel_country,
+        title: str,
+        aye_count: int,
+        no_count: int,
+        double_majority_aye_count: int,
+        double_majority_no_count: int,
+        aye_teller_ids: Sequence[int] = (),
+        no_teller_ids: Sequence[int] = (),
+        aye_member_ids: Sequence[int] = (),
+        no_member_ids: Sequence[int] = (),
+        didnt_vote_member_ids: Sequence[int] = (),
+    ):
+        """
+        Creates a commons division straight from its fields, e.g. when rehydrating a division
+        from a local cache, skipping the JSON object lookups of the constructor. The members and
+        tellers are left unpopulated, as they are with the constructor.
+
+        Parameters
+        ----------
+        division_id: :class:`int`
+            The division id.
+        date: :class:`datetime`
+            The date the division was taken.
+        publication_uploaded: :class:`datetime`
+            The date the division publication was uploaded.
+        number: :class:`int`
+            The division number.
+        deferred: :class:`bool`
+            If the division was deferred.
+        evel_type: :class:`object`
+            The evel type.
+        evel_country: :class:`object`
+            The evel country.
+        title: :class:`str`
+            The division title.
+        aye_count: :class:`int`
+            The total of members who voted Yes.
+        no_count: :class:`int`
+            The total of members who voted No.
+        double_majority_aye_count: :class:`int`
+            The double majority count of the ayes.
+        double_majority_no_count: :class:`int`
+            The double majority count of the noes.
+        aye_teller_ids: :class:`Sequence[int]`
+            The ids of the Tellars for the Ayes.
+        no_teller_ids: :class:`Sequence[int]`
+            The ids of the Tellars for the Noes.
+        aye_member_ids: :class:`Sequence[int]`
+            The ids of the members who voted Yes.
+        no_member_ids: :class:`Sequence[int]`
+            The ids of the members who voted No.
+        didnt_vote_member_ids: :class:`Sequence[int]`
+            The ids of the members who didn't vote.
+
+        Returns
+        -------
+        A :class:`CommonsDivision` instance.
+        """
+        division = cls.__new__(cls)
+        division._division_id = division_id
+        division._date = date
+        division._publiciation_uploaded = publication_uploaded
+        division._number = number
+        division._deferred = deferred
+        division._evel_type = _intern(evel_type)
+        division._evel_country = _intern(evel_country)
+        division._title = title
+        division._aye_count = aye_count
+        division._no_count = no_count
+        division._double_majority_aye_count = double_majority_aye_count
+        division._double_majority_no_count = double_majority_no_count
+        division._aye_teller_ids = list(aye_teller_ids)
+        division._no_teller_ids = list(no_teller_ids)
+        division._aye_ids = array("i", aye_member_ids)
+        division._no_ids = array("i", no_member_ids)
+        division._no_vote_ids = array("i", didnt_vote_member_ids)
+        division._ayes_members = None
+        division._noes_members = None
+        division._didnt_vote = None
+        division._aye_tellers = None
+        division._no_tellers = None
+        return division
 
     def get_aye_count(self) -> int:
         """
@@ -733,21 +1129,21 @@ class CommonsDivision:
         """
         self._no_tellers = members
 
-    def get_aye_member_ids(self) -> list[int]:
+    def get_aye_member_ids(self) -> Sequence[int]:
         """
-        Returns a list of :class:`int` associated with the members who voted Yes.
+        Returns an :class:`array` of :class:`int` associated with the members who voted Yes.
         """
         return self._aye_ids
 
-    def get_no_member_ids(self) -> list[int]:
+    def get_no_member_ids(self) -> Sequence[int]:
         """
-        Returns a list of :class:`int` associated with the members who voted No.
+        Returns an :class:`array` of :class:`int` associated with the members who voted No.
         """
         return self._no_ids
 
-    def get_didnt_vote_member_ids(self) -> list[int]:
+    def get_didnt_vote_member_ids(self) -> Sequence[int]:
         """
-        Returns a list of :class:`int` associated with the members who didn't vote.
+        Returns an :class:`array` of :class:`int` associated with the members who didn't vote.
         """
         return self._no_vote_ids
 
@@ -767,16 +1163,16 @@ class CommonsDivision:
         """
         Returns a list of members who voted Yes.
         """
-        return self._ayes_members
+        return self._ayes_members or []
 
     def get_no_members(self) -> list[PartyMember]:
         """
         Reutrns a list of members who voted No.
         """
-        return self._noes_members
+        return self._noes_members or []
 
     def get_didnt_vote_members(self) -> list[PartyMember]:
         """
         Returns a list of members who didn't vote.
         """
-        return self._didnt_vote
+        return self._didnt_vote or []
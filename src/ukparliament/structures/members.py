@@ -71,6 +71,16 @@ class VotingEntry:
 
 
 class ElectionResult:
+    __slots__ = (
+        "result",
+        "notional",
+        "electorate",
+        "turnout",
+        "date",
+        "majority",
+        "candidates",
+    )
+
     def __init__(self, json_object):
         """
         An election result in the UK referrs to the local election result of a constitueny. This class therefore
@@ -90,9 +100,10 @@ class ElectionResult:
         self.candidates = []
 
         for candidate_object in json_object["candidates"]:
+            candidate_party = candidate_object["party"]
             candidate_name = candidate_object["name"]
-            candidate_party_id = candidate_object["party"]["id"]
-            candidate_party_name = candidate_object["party"]["name"]
+            candidate_party_id = candidate_party["id"]
+            candidate_party_name = candidate_party["name"]
             vote_share_change = candidate_object["resultChange"]
             candidate_order = candidate_object["rankOrder"]
             votes_received = candidate_object["votes"]
@@ -404,12 +415,29 @@ class PartyMemberBiography:
 
 
 class PartyMember:
+    __slots__ = (
+        "_member_id",
+        "_titled_name",
+        "_addressed_name",
+        "_displayed_name",
+        "_listed_name",
+        "_party_id",
+        "_gender",
+        "_started",
+        "_thumbnail",
+        "_house_id",
+        "_membership_from",
+        "_membership_id",
+        "_biography",
+    )
+
     def __init__(self, json_object):
         """
         A party member is a member of a party - a political party being a group of politicians with the same agenda
         working as a block. This class represents one Party Member.
         """
         value_object = json_object["value"]
+        house_membership = value_object["latestHouseMembership"]
         self._member_id = value_object["id"]
         self._titled_name = value_object["nameFullTitle"]
         self._addressed_name = value_object["nameAddressAs"]
@@ -418,12 +446,13 @@ class PartyMember:
         self._party_id = value_object["latestParty"]["id"]
         self._gender = value_object["gender"]
         self._started = datetime.fromisoformat(
-            value_object["latestHouseMembership"]["membershipStartDate"]
+            house_membership["membershipStartDate"]
         )
         self._thumbnail = value_object["thumbnailUrl"]
-        self._house_id = value_object["latestHouseMembership"]["house"]
-        self._membership_from = value_object["latestHouseMembership"]["membershipFrom"]
-        self._membership_id = value_object["latestHouseMembership"]["membershipFromId"]
+        self._house_id = house_membership["house"]
+        self._membership_from = house_membership["membershipFrom"]
+        self._membership_id = house_membership["membershipFromId"]
+        self._biography: Union[PartyMemberBiography, None] = None
 
     def get_biography(self) -> Union[PartyMemberBiography, None]:
         """
@@ -529,6 +558,22 @@ class PartyMember:
 
 
 class Party:
+    __slots__ = (
+        "_party_id",
+        "_name",
+        "_abbreviation",
+        "_primary_colour",
+        "_secondary_colour",
+        "_lords_govt_party",
+        "_lords_party",
+        "_lords_spiritual_party",
+        "_governing",
+        "_governing_capacity",
+        "_independent_group",
+        "_hoc_members",
+        "_hol_members",
+    )
+
     def __init__(self, json_object):
         """
         A party is a group of members within the Houses of Parliament that act as one block with one agenda.
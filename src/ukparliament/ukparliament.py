@@ -1,19 +1,19 @@
 import asyncio
+from bisect import bisect_left
 from datetime import datetime
 from threading import Lock
-from typing import Union
+from typing import Sequence, Union
+from urllib.parse import quote
 
-import aiohttp
-import bs4
 from aiohttp.client import ClientSession
 from cachetools import TTLCache
 
 from . import utils
-from .bills import _meta_bill_task, division_task
+from .bills import _enrich_bill_task, _meta_bill_task
 from .bills_tracker import (BillsStorage, BillsTracker, PublicationsTracker,
                             dual_event_loop)
 from .divisions_tracker import DivisionStorage, DivisionsTracker
-from .members import er_task, vh_task
+from .members import MAX_ELECTION_RESULT_FETCHES, er_task, vh_task
 from .structures.bills import (Bill, BillStage, BillType, CommonsDivision,
                                LordsDivision)
 from .structures.members import (ElectionResult, Party, PartyMember,
@@ -32,13 +32,36 @@ index unnecessary data.
 
 
 class UKParliament:
-    def __init__(self, session: ClientSession):
-        self.session = session
+    def __init__(self, session: Union[ClientSession, None] = None):
+        """
+        The main class, used to index and fetch data from the UK Parliament REST API.
+
+        The instance can be constructed outside of an event loop, but must be loaded with
+        :meth:`load` from within the running event loop it will be used on before anything
+        else is called. The session (if none is provided) is created there, so it's bound to
+        that loop. The semaphores bounding concurrent requests are created on first use.
+
+        Parameters
+        ----------
+        session: :class:`ClientSession`
+            The aiohttp session shared by every request the instance makes. If none
+            is provided, one is created with a bounded connection pool by :meth:`load`.
+        """
+        self._owns_session = session is None
+        self.session: Union[ClientSession, None] = session
+        self.member_semaphore: Union[asyncio.Semaphore, None] = None
+        self.election_result_semaphore: Union[asyncio.Semaphore, None] = None
         self.parties: list[Party] = []
+        self._parties_by_id: dict[int, Party] = {}
+        self._members_by_id: dict[int, PartyMember] = {}
+        self._commons_member_names: list[str] = []
+        self._commons_members_by_name: list[PartyMember] = []
         self.bill_types: list[BillType] = []
         self.bill_stages: list[BillStage] = []
+        self._bill_stages_by_id: dict[int, BillStage] = {}
         self.old_member_cache = TTLCache(maxsize=90, ttl=600)
         self.old_member_cache_lock = Lock()
+        self._member_inflight: dict[int, asyncio.Future] = {}
         self.bill_search_cache = TTLCache(maxsize=90, ttl=180)
         self.bill_search_cache_lock = Lock()
         self.division_cache = TTLCache(maxsize=90, ttl=600)
@@ -56,7 +79,6 @@ class UKParliament:
         self.bills_tracker = None
         self.divisions_tracker = None
         self.publications_tracker = None
-        print(f"BS4 Version: {bs4.__version__}")
 
     def start_publications_tracker(self, tracker: BillsTracker):
         """
@@ -85,6 +107,10 @@ class UKParliament:
         storage: :class:`BillsStorage`
             The inferface used to store data relevant to the tracker.
         """
+        if self.session is None:
+            raise Exception(
+                "UKParliament has to be loaded before the bills tracker is started."
+            )
         self.bills_tracker = BillsTracker(self, storage, self.session)
 
     async def load_bills_tracker(self):
@@ -131,21 +157,33 @@ class UKParliament:
         """
         return self.divisions_tracker
 
+    async def close(self):
+        """
+        Closes the aiohttp session, if it was created by this instance. Sessions passed
+        in are left for the caller to close.
+        """
+        if self._owns_session and self.session is not None and not self.session.closed:
+            await self.session.close()
+
     async def load(self):
         """
         Loads the UKParliament instance. Indexed parties, party members (MPs and Lords),
-        Bill types and Bill stages.
+        Bill types and Bill stages. Has to be awaited within the running event loop the
+        instance is used on.
         """
+        if self.session is None:
+            self.session = utils.create_session()
+
         async with self.session.get(
             f"{utils.URL_MEMBERS}/Parties/GetActive/Commons"
         ) as resp:
             if resp.status != 200:
                 print(resp.url)
                 raise Exception("Couldn't fetch active parties in the House of Commons")
-            content = await resp.json()
+            content = await utils.read_json(resp)
 
             for item in content["items"]:
-                self.parties.append(Party(item))
+                self._add_party(Party(item))
 
         async with self.session.get(
             f"{utils.URL_MEMBERS}/Parties/GetActive/Lords"
@@ -153,20 +191,21 @@ class UKParliament:
             if resp.status != 200:
                 raise Exception("Couldn't fetch active parties in the House of Lords")
 
-            content = await resp.json()
+            content = await utils.read_json(resp)
 
             for item in content["items"]:
                 party = self.get_party_by_id(item["value"]["id"])
                 if party is None:
-                    self.parties.append(Party(item))
+                    self._add_party(Party(item))
                 else:
                     party.set_lords_party()
 
-        json_party_members = await utils.load_data(
-            f"{utils.URL_MEMBERS}/Members/Search?IsCurrentMember=true", self.session
+        party_members = await utils.load_data(
+            f"{utils.URL_MEMBERS}/Members/Search?IsCurrentMember=true",
+            self.session,
+            item_factory=PartyMember,
         )
-        for json_member in json_party_members:
-            member = PartyMember(json_member)
+        for member in party_members:
             party = self.get_party_by_id(member.get_party_id())
 
             if party is None:
@@ -177,6 +216,17 @@ class UKParliament:
                 continue
 
             party.add_member(member)
+            self._members_by_id[member.get_id()] = member
+
+        named_members = sorted(
+            (
+                (member.get_display_name().lower(), member)
+                for member in self.get_commons_members()
+            ),
+            key=lambda entry: entry[0],
+        )
+        self._commons_member_names = [name for name, _ in named_members]
+        self._commons_members_by_name = [member for _, member in named_members]
 
         async with self.session.get(f"{utils.URL_BILLS}/BillTypes") as bt_resp:
             if bt_resp.status != 200:
@@ -184,18 +234,30 @@ class UKParliament:
                     f"Couldn't fetch bill types. Status Code: {bt_resp.status}"
                 )
 
-            content = await bt_resp.json()
+            content = await utils.read_json(bt_resp)
 
             for item in content["items"]:
                 self.bill_types.append(BillType(item))
 
-        json_bill_stages = await utils.load_data(
-            f"{utils.URL_BILLS}/Stages", self.session
+        bill_stages = await utils.load_data(
+            f"{utils.URL_BILLS}/Stages", self.session, item_factory=BillStage
         )
 
-        for json_bill_stage in json_bill_stages:
-            bill_stage = BillStage(json_bill_stage)
+        for bill_stage in bill_stages:
             self.bill_stages.append(bill_stage)
+            self._bill_stages_by_id[bill_stage.get_stage_id()] = bill_stage
+
+    def _add_party(self, party: Party):
+        """
+        Adds a party to the list of indexed parties.
+
+        Parameters
+        ----------
+        party: :class:`Party`
+            The party to add.
+        """
+        self.parties.append(party)
+        self._parties_by_id[party.get_party_id()] = party
 
     async def get_biography(self, member: PartyMember) -> PartyMemberBiography:
         """
@@ -219,7 +281,7 @@ class UKParliament:
                     f"Couldn't load member bio of {member.get_id()}/{member.get_listed_name()}."
                     f" Status Code: {bio_resp.status}"
                 )
-            bio_content = await bio_resp.json()
+            bio_content = await utils.read_json(bio_resp)
             return PartyMemberBiography(bio_content)
 
     async def get_election_results(self, member: PartyMember) -> list[ElectionResult]:
@@ -243,7 +305,13 @@ class UKParliament:
             if cached_obj is not None:
                 return cached_obj
 
-        election_result = await asyncio.gather(er_task(member, self.session))
+        if self.election_result_semaphore is None:
+            self.election_result_semaphore = asyncio.Semaphore(
+                MAX_ELECTION_RESULT_FETCHES
+            )
+        election_result = await asyncio.gather(
+            er_task(member, self.session, self.election_result_semaphore)
+        )
         elections = election_result[0]
 
         with self.election_results_lock:
@@ -268,14 +336,12 @@ class UKParliament:
             if cached_obj is not None:
                 return cached_obj
 
-        async with aiohttp.ClientSession() as session:
-            await asyncio.gather(
-                vh_task(
-                    member, session, self.voting_history_cache, self.voting_history_lock
-                )
-            )
-
-        return await self.get_voting_history(member)
+        return await vh_task(
+            member,
+            self.session,
+            self.voting_history_cache,
+            self.voting_history_lock,
+        )
 
     def get_party_by_name(self, name: str) -> Union[Party, None]:
         """
@@ -308,10 +374,7 @@ class UKParliament:
         -------
         Returns an instance of a :class:`Party`
         """
-        for party in self.parties:
-            if party.get_party_id() == party_id:
-                return party
-        return None
+        return self._parties_by_id.get(party_id)
 
     def get_commons_members(self) -> list[PartyMember]:
         """
@@ -350,17 +413,12 @@ class UKParliament:
         -------
         A :class:`PartyMember` instance.
         """
-        for member in self.get_commons_members():
-            if member.get_id() == member_id:
-                return member
-        for member in self.get_lords_members():
-            if member.get_id() == member_id:
-                return member
-        return None
+        return self._members_by_id.get(member_id)
 
     def get_member_by_name(self, member_name: str) -> Union[PartyMember, None]:
         """
-        Fetches a :class:`PartyMember` via the member's name.
+        Fetches a :class:`PartyMember` via the member's name, or the start of it.
+        An exact match is always preferred over a partial one.
 
         Parameters
         ----------
@@ -371,18 +429,22 @@ class UKParliament:
         -------
         A :class:`PartyMember` instance.
         """
-        for member in self.get_commons_members():
-            if member_name.lower() is member.get_display_name().lower():
-                return member
+        name = member_name.lower()
+        index = bisect_left(self._commons_member_names, name)
+        if index < len(self._commons_member_names) and self._commons_member_names[
+            index
+        ].startswith(name):
+            return self._commons_members_by_name[index]
         return None
 
-    # Cheap Workaround to using a cache, something I'll implement later
     async def lazy_load_member(self, member_id: int) -> PartyMember:
         """
         Fetches a party member lazily. Meaning that the party member data is fetched and
         a :class:`PartyMember` is instantiated rather than the data being indexed when
         within the :func:`load` function.
 
+        Loaded members are cached, and concurrent calls for the same id share one request.
+
         Parameters
         ----------
         member_id:`int`
@@ -397,14 +459,45 @@ class UKParliament:
             if cached_obj is not None:
                 return cached_obj
 
-        async with self.session.get(f"{utils.URL_MEMBERS}/Members/{member_id}") as resp:
-            if resp.status != 200:
-                raise Exception(
-                    f"Couldn't lazily load member under id {member_id}. Status Code: {resp.status}."
-                )
-            content = await resp.json()
-            member = PartyMember(content)
-            return member
+        inflight = self._member_inflight.get(member_id)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._fetch_member(member_id))
+            self._member_inflight[member_id] = inflight
+            inflight.add_done_callback(
+                lambda _: self._member_inflight.pop(member_id, None)
+            )
+        # Shielded so a cancelled caller doesn't cancel the fetch for the other callers.
+        return await asyncio.shield(inflight)
+
+    async def _fetch_member(self, member_id: int) -> PartyMember:
+        """
+        Fetches a party member from the REST API and caches it.
+
+        Parameters
+        ----------
+        member_id:`int`
+            The id of a :class:`PartyMember`
+
+        Returns
+        -------
+        A :class:`PartyMember` instance.
+        """
+        if self.member_semaphore is None:
+            self.member_semaphore = asyncio.Semaphore(utils.MAX_CONNECTIONS_PER_HOST)
+        async with self.member_semaphore:
+            async with self.session.get(
+                f"{utils.URL_MEMBERS}/Members/{member_id}"
+            ) as resp:
+                if resp.status != 200:
+                    raise Exception(
+                        f"Couldn't lazily load member under id {member_id}. Status Code: {resp.status}."
+                    )
+                content = await utils.read_json(resp)
+                member = PartyMember(content)
+
+        with self.old_member_cache_lock:
+            self.old_member_cache[member_id] = member
+        return member
 
     def get_bill_stages(self) -> list[BillStage]:
         """
@@ -412,6 +505,21 @@ class UKParliament:
         """
         return self.bill_stages
 
+    def get_bill_stage_by_id(self, stage_id: int) -> Union[BillStage, None]:
+        """
+        Fetches a :class:`BillStage` via the stage id.
+
+        Parameters
+        ----------
+        stage_id: :class:`int`
+            The id of a bill stage.
+
+        Returns
+        -------
+        A :class:`BillStage` instance.
+        """
+        return self._bill_stages_by_id.get(stage_id)
+
     def get_bill_types(self) -> list[BillType]:
         """
         Returns a list of :class:`BillType` instances.
@@ -439,13 +547,16 @@ class UKParliament:
         async with self.session.get(f"{utils.URL_BILLS}/Bills/{bill_id}") as resp:
             if resp.status != 200:
                 raise Exception(f"Failed to fetch bill under id {bill_id}")
-            content = await resp.json()
-            bill = Bill(content)
-            await _meta_bill_task(bill, self, self.session)
+            content = await utils.read_json(resp)
+
+        # The full record is already at hand, so it is enriched directly rather than
+        # fetched a second time through _meta_bill_task.
+        bill = Bill(content)
+        await _enrich_bill_task(bill, self, content)
 
-            with self.bills_cache_lock:
-                self.bills_cache[bill_id] = bill
-            return bill
+        with self.bills_cache_lock:
+            self.bills_cache[bill_id] = bill
+        return bill
 
     async def search_bills(self, url: str) -> list[Bill]:
         """
@@ -471,7 +582,7 @@ class UKParliament:
                     f"Couldn't fetch bills with url: {url}. Status Code: {resp.status}"
                 )
 
-            content = await resp.json()
+            content = await utils.read_json(resp)
             bills = []
 
             extra_bill_information_tasks = []
@@ -482,7 +593,8 @@ class UKParliament:
                     _meta_bill_task(bill, self, self.session)
                 )
                 bills.append(bill)
-            await asyncio.gather(*extra_bill_information_tasks)
+            if len(extra_bill_information_tasks) > 0:
+                await asyncio.gather(*extra_bill_information_tasks)
 
             with self.bill_search_cache_lock:
                 self.bill_search_cache[url] = bills
@@ -513,7 +625,7 @@ class UKParliament:
                 raise Exception(
                     f"Couldn't fetch division {division_id}. Status Code: {resp.status}"
                 )
-            content = await resp.json()
+            content = await utils.read_json(resp)
 
             division = CommonsDivision(content)
             await self._populate_commons_division(division)
@@ -547,7 +659,7 @@ class UKParliament:
                 raise Exception(
                     f"Couldn't fetch division {division_id}. Status Code: {resp.status}"
                 )
-            content = await resp.json()
+            content = await utils.read_json(resp)
             division = LordsDivision(content)
             await self._populate_lords_division(division)
             with self.division_cache_lock:
@@ -581,7 +693,7 @@ class UKParliament:
             async with self.session.get(
                 (
                     f"{utils.URL_LORDS_VOTES}/Divisions/searchTotalResults"
-                    f"?SearchTerm={formatted_search_term}"
+                    f"?SearchTerm={search_term}"
                 )
             ) as resp:
                 if resp.status != 200:
@@ -589,9 +701,9 @@ class UKParliament:
                         "Couldn't fetch total search results for division search with query: "
                         f"{search_term}. Status Code: {resp.status}"
                     )
-                return await resp.json()
+                return await utils.read_json(resp)
 
-        formatted_search_term = "%20".join(search_term.split(" "))
+        formatted_search_term = quote(search_term)
         total_search_results = (
             await get_total_results(formatted_search_term)
             if result_limit == -1
@@ -605,12 +717,10 @@ class UKParliament:
             total_search_results,
         )
 
-        divisions = []
-
-        for item in division_items:
-            division = LordsDivision(item)
-            await self._populate_lords_division(division)
-            divisions.append(division)
+        divisions = [LordsDivision(item) for item in division_items]
+        await asyncio.gather(
+            *[self._populate_lords_division(division) for division in divisions]
+        )
 
         if search_term != "":
             with self.division_search_lords_lock:
@@ -644,7 +754,7 @@ class UKParliament:
         async def get_total_results(search_term: str):
             async with self.session.get(
                 f"{utils.URL_COMMONS_VOTES}/divisions.json/searchTotalResults"
-                f"?queryParameters.searchTerm={formatted_search_term}"
+                f"?queryParameters.searchTerm={search_term}"
             ) as resp:
                 if resp.status != 200:
                     raise Exception(
@@ -652,10 +762,10 @@ class UKParliament:
                         f" '{search_term}. Status Code: {resp.status}"
                     )
 
-                total_search_results = await resp.json()
+                total_search_results = await utils.read_json(resp)
                 return total_search_results
 
-        formatted_search_term = "%20".join(search_term.split(" "))
+        formatted_search_term = quote(search_term)
         total_search_results = (
             await get_total_results(formatted_search_term)
             if result_limit == -1
@@ -672,11 +782,10 @@ class UKParliament:
             self.session,
             total_search_results,
         )
-        divisions = []
-        for item in division_items:
-            division = CommonsDivision(item)
-            await self._populate_commons_division(division)
-            divisions.append(division)
+        divisions = [CommonsDivision(item) for item in division_items]
+        await asyncio.gather(
+            *[self._populate_commons_division(division) for division in divisions]
+        )
 
         if search_term != "":
             with self.division_search_commons_lock:
@@ -690,6 +799,41 @@ class UKParliament:
         """
         return self.parties
 
+    async def _load_members(self, member_ids: Sequence[int]) -> list[PartyMember]:
+        """
+        Resolves member ids to :class:`PartyMember` instances. Members that are already
+        indexed are resolved locally, the remaining ids are lazily loaded, each id only
+        once.
+
+        Parameters
+        ----------
+        member_ids: :class:`Sequence[int]`
+            The ids of the members to resolve.
+
+        Returns
+        -------
+        A list of :class:`PartyMember` instances, in the same order as the ids.
+        """
+        members = [self.get_member_by_id(member_id) for member_id in member_ids]
+        missing_ids = list(
+            dict.fromkeys(
+                member_id
+                for member_id, member in zip(member_ids, members)
+                if member is None
+            )
+        )
+        if len(missing_ids) == 0:
+            return members
+
+        loaded_members = await utils.gather_tasks(
+            *[self.lazy_load_member(member_id) for member_id in missing_ids]
+        )
+        loaded_by_id = dict(zip(missing_ids, loaded_members))
+        return [
+            member if member is not None else loaded_by_id[member_id]
+            for member_id, member in zip(member_ids, members)
+        ]
+
     async def _populate_lords_division(self, division: LordsDivision):
         """
         Populates a :class:`LordsDivision` with references to data already
@@ -700,43 +844,16 @@ class UKParliament:
         division: :class:`LordsDivision`
             The division instance to populate.
         """
-        aye_tellers = []
-        a_teller_tasks = list(
-            map(
-                lambda teller: division_task(self, teller, aye_tellers),
-                division.get_aye_teller_ids(),
-            )
+        aye_tellers, no_tellers, aye_members, no_members = await asyncio.gather(
+            self._load_members(division.get_aye_teller_ids()),
+            self._load_members(division.get_no_teller_ids()),
+            self._load_members(division.get_aye_vote_member_ids()),
+            self._load_members(division.get_no_vote_member_ids()),
         )
-        await asyncio.gather(*a_teller_tasks)
         division.set_aye_tellers(aye_tellers)
-        no_tellers = []
-        n_teller_tasks = list(
-            map(
-                lambda teller: division_task(self, teller, no_tellers),
-                division.get_no_teller_ids(),
-            )
-        )
-        await asyncio.gather(*n_teller_tasks)
         division.set_no_tellers(no_tellers)
-        no_members = []
-        n_members_tasks = list(
-            map(
-                lambda member_id: division_task(self, member_id, no_members),
-                division.get_no_vote_member_ids(),
-            )
-        )
-        await asyncio.gather(*n_members_tasks)
-        division.set_no_members(no_members)
-
-        aye_members = []
-        a_members_tasks = list(
-            map(
-                lambda member_id: division_task(self, member_id, aye_members),
-                division.get_aye_vote_member_ids(),
-            )
-        )
-        await asyncio.gather(*a_members_tasks)
         division.set_aye_members(aye_members)
+        division.set_no_members(no_members)
 
     async def _populate_commons_division(self, division: CommonsDivision):
         """
@@ -748,41 +865,13 @@ class UKParliament:
         division: :class:`CommonsDivision`
             The division instance to populate.
         """
-        aye_tellers = []
-        a_teller_tasks = list(
-            map(
-                lambda teller: division_task(self, teller, aye_tellers),
-                division.get_aye_teller_ids(),
-            )
+        aye_tellers, no_tellers, aye_members, no_members = await asyncio.gather(
+            self._load_members(division.get_aye_teller_ids()),
+            self._load_members(division.get_no_teller_ids()),
+            self._load_members(division.get_aye_member_ids()),
+            self._load_members(division.get_no_member_ids()),
         )
-        await asyncio.gather(*a_teller_tasks)
-        division.set_aye_members(aye_tellers)
-
-        no_tellers = []
-        n_teller_tasks = list(
-            map(
-                lambda teller: division_task(self, teller, no_tellers),
-                division.get_no_teller_ids(),
-            )
-        )
-        await asyncio.gather(*n_teller_tasks)
-
-        aye_members = []
-        aye_members_tasks = list(
-            map(
-                lambda member_id: division_task(self, member_id, aye_members),
-                division.get_aye_member_ids(),
-            )
-        )
-        await asyncio.gather(*aye_members_tasks)
+        division.set_aye_tellers(aye_tellers)
+        division.set_no_tellers(no_tellers)
         division.set_aye_members(aye_members)
-
-        no_members = []
-        no_members_tasks = list(
-            map(
-                lambda member_id: division_task(self, member_id, no_members),
-                division.get_no_member_ids(),
-            )
-        )
-        await asyncio.gather(*no_members_tasks)
         division.set_no_members(no_members)
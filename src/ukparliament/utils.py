@@ -1,13 +1,20 @@
 import math
+import sys
 import asyncio
 from enum import Enum
+from typing import Any, Callable, Union
 import aiohttp
+import orjson
 
 URL_COMMONS_VOTES = "https://commonsvotes-api.parliament.uk/data"
 URL_LORDS_VOTES = "https://lordsvotes-api.parliament.uk/data"
 URL_MEMBERS = "https://members-api.parliament.uk/api"
 URL_BILLS = "https://bills-api.parliament.uk/api/v1"
 
+MAX_CONNECTIONS = 100
+MAX_CONNECTIONS_PER_HOST = 20
+KEEPALIVE_TIMEOUT = 60
+
 
 class BetterEnum(Enum):
     """
@@ -21,8 +28,106 @@ class BetterEnum(Enum):
                 return option
 
 
+def create_session() -> aiohttp.ClientSession:
+    """
+    Creates a aiohttp session with a bounded connection pool. All requests to the
+    Parliament REST API are made against a handful of hosts, so capping the connections
+    per host keeps the library from opening a socket (and TLS handshake) for every
+    concurrent request. Idle connections are kept alive for longer than the trackers'
+    poll interval, so each poll reuses the previous poll's connections.
+
+    Returns
+    -------
+    A :class:`ClientSession` instance.
+    """
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=MAX_CONNECTIONS,
+            limit_per_host=MAX_CONNECTIONS_PER_HOST,
+            ttl_dns_cache=300,
+            keepalive_timeout=KEEPALIVE_TIMEOUT,
+        )
+    )
+
+
+async def gather_tasks(*coros) -> list:
+    """
+    Runs coroutines concurrently and returns their results in order. On Python 3.11+ the
+    coroutines run in a :class:`TaskGroup`, so one failing cancels the rest and frees their
+    connections straight away. Older versions fall back to :func:`asyncio.gather`. Either way
+    the first error is raised as is, never wrapped in an :class:`ExceptionGroup`.
+
+    Parameters
+    ----------
+    coros: :class:`Coroutine`
+        The coroutines to run.
+
+    Returns
+    -------
+    A :class:`list` of results.
+    """
+    if sys.version_info < (3, 11):
+        return list(await asyncio.gather(*coros))
+
+    try:
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(coro) for coro in coros]
+    except BaseExceptionGroup as errors:
+        # Keep the exception contract of asyncio.gather, so callers' except clauses still match.
+        error = errors.exceptions[0]
+        while isinstance(error, BaseExceptionGroup):
+            error = error.exceptions[0]
+        raise error from None
+    return [task.result() for task in tasks]
+
+
+async def read_json(resp: aiohttp.ClientResponse):
+    """
+    Reads the body of a response and decodes it with orjson, skipping aiohttp's
+    stdlib json wrapper.
+
+    Parameters
+    ----------
+    resp: :class:`ClientResponse`
+        The aiohttp response.
+
+    Returns
+    -------
+    The decoded JSON content.
+    """
+    return orjson.loads(await resp.read())
+
+
+def conditional_headers(
+    etag: Union[str, None], last_modified: Union[str, None]
+) -> dict[str, str]:
+    """
+    Builds the headers of a conditional request from the validators of a previous response.
+
+    Parameters
+    ----------
+    etag: :class:`str`
+        The ETag header of the previous response, if any.
+    last_modified: :class:`str`
+        The Last-Modified header of the previous response, if any.
+
+    Returns
+    -------
+    A :class:`dict` of headers.
+    """
+    headers = {}
+    if etag is not None:
+        headers["If-None-Match"] = etag
+    if last_modified is not None:
+        headers["If-Modified-Since"] = last_modified
+    return headers
+
+
 async def load_data(
-    url: str, session: aiohttp.ClientSession, total_search_results: int = -1
+    url: str,
+    session: aiohttp.ClientSession,
+    total_search_results: int = -1,
+    item_factory: Union[Callable[[Any], Any], None] = None,
 ):
     """
     Iterates through results that are pageinated and stiches all the results together.
@@ -37,6 +142,9 @@ async def load_data(
         Used in specific cases where the total results of the data aren't included
         in the GET request reponse. Can also be used to fetch a specific amount of
         search results from the endpoint.
+    item_factory: :class:`Callable`
+        Used to convert each item as its page arrives, so the raw JSON of a page
+        can be released before the remaining pages are stitched together.
 
     Returns
     -------
@@ -44,54 +152,66 @@ async def load_data(
 
     """
 
-    async with session.get(url) as resp:
-        final_list = []
-        is_division_url = url.startswith(URL_COMMONS_VOTES) or url.startswith(
-            URL_LORDS_VOTES
-        )
+    is_division_url = url.startswith(URL_COMMONS_VOTES) or url.startswith(
+        URL_LORDS_VOTES
+    )
+
+    def page_items(page_content) -> list:
+        items = page_content["items"] if is_division_url is False else page_content
+        return list(items if item_factory is None else map(item_factory, items))
 
-        async def task(t_url: str):
-            async with session.get(t_url) as t_resp:
-                if t_resp.status != 200:
-                    raise Exception(
-                        f"Couldn't fetch data from {t_url}: Status Code: {t_resp.status}"
-                    )
-                t_content = await t_resp.json()
-                final_list.extend(
-                    t_content["items"] if is_division_url is False else t_content
+    async def task(t_url: str) -> list:
+        async with session.get(t_url) as t_resp:
+            if t_resp.status != 200:
+                raise Exception(
+                    f"Couldn't fetch data from {t_url}: Status Code: {t_resp.status}"
                 )
+            t_content = await read_json(t_resp)
+        return page_items(t_content)
 
-        tasks = []
+    async with session.get(url) as resp:
         if resp.status != 200:
             raise Exception(
                 f"Couldn't fetch data from {url}: Status Code: {resp.status}"
             )
-        content = await resp.json()
-        total_results = (
-            content["totalResults"]
-            if "totalResults" in content
-            else content["totalItems"]
-            if "totalItems" in content
-            else 0
-        )
-        if total_search_results != -1:
-            total_results = total_search_results
-        pages = math.ceil(total_results / 20)
-        element = "&"
-        if "?" not in url:
-            element = "?"
-
-        for page in range(pages):
-            skipSegment = (
-                f"{element}skip={page * 20}&take=20"
-                if url.startswith(URL_COMMONS_VOTES) is False
-                else f"{element}queryParameters.skip={page * 20}&queryParameters.take=20"
-            )
-            tasks.append(task(f"{url}{skipSegment if page != 0 else ''}"))
+        content = await read_json(resp)
+
+    total_results = (
+        content["totalResults"]
+        if "totalResults" in content
+        else content["totalItems"]
+        if "totalItems" in content
+        else 0
+    )
+    if total_search_results != -1:
+        total_results = total_search_results
+    pages = math.ceil(total_results / 20)
 
-        await asyncio.gather(*tasks)
-        return (
-            final_list[0:total_results]
-            if (total_results != 0 and total_results != -1)
-            else final_list
+    if pages == 0:
+        return []
+
+    element = "&"
+    if "?" not in url:
+        element = "?"
+
+    # The first response already is page 0, so only the remaining pages are
+    # fetched, concurrently, and stitched back together in page order.
+    tasks = []
+    for page in range(1, pages):
+        skipSegment = (
+            f"{element}skip={page * 20}&take=20"
+            if url.startswith(URL_COMMONS_VOTES) is False
+            else f"{element}queryParameters.skip={page * 20}&queryParameters.take=20"
         )
+        tasks.append(task(f"{url}{skipSegment}"))
+
+    first_page = page_items(content)
+    del content
+    final_list = [
+        item for page in [first_page, *await asyncio.gather(*tasks)] for item in page
+    ]
+    return (
+        final_list[0:total_results]
+        if (total_results != 0 and total_results != -1)
+        else final_list
+    )